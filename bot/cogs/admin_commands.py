@@ -7,11 +7,32 @@ It includes commands for managing users, roles, channels, and more.
 This cog is automatically loaded by the bot on startup.
 """
 
+import asyncio
+from datetime import timedelta
 import discord
 from discord.ext import commands
+from discord.ext.commands import BucketType
 from utils.custom_exceptions import CommandError
 import logging
 
+logger = logging.getLogger('admin_commands')
+
+# Reply and error message templates shared by the moderation commands
+_NO_PERM_TMPL = "I don't have permission to {} that user."
+_ERR_TMPL = "An error occurred while trying to {} {}."
+
+# Discord's bulk delete endpoint rejects messages older than this
+BULK_DELETE_MAX_AGE_DAYS = 14
+
+# Member moderation actions: name -> (past tense, reply suffix, skip invoker and bot,
+# coroutine factory(cog, guild, member, reason))
+_ACTIONS = {
+    'kick': ('kicked', ' from the server', True, lambda cog, guild, m, r: guild.kick(discord.Object(id=m.id), reason=r)),
+    'ban': ('banned', ' from the server', True, lambda cog, guild, m, r: guild.ban(discord.Object(id=m.id), reason=r)),
+    'mute': ('muted', '', False, lambda cog, guild, m, r: cog._apply_mute(guild, m, r)),
+    'unmute': ('unmuted', '', False, lambda cog, guild, m, r: m.remove_roles(cog._get_mute_role(guild), reason=r)),
+}
+
 class AdminCommands(commands.Cog):
     """
     Cog for administrative commands.
@@ -27,57 +48,226 @@ class AdminCommands(commands.Cog):
             bot (commands.Bot): The bot instance.
         """
         self.bot = bot
-        self.logger = logging.getLogger('admin_commands')
+        self.logger = logger
+        self._mute_role_cache: dict[int, int] = {}  # guild.id -> Muted role.id
+        bot_config = getattr(getattr(bot, 'config', None), 'bot', None)
+        self._announce_channel_name = getattr(bot_config, 'announcement_channel', 'announcements')
+        self._announce_channel_cache: dict[int, int] = {}  # guild.id -> announcement channel.id
+
+    def _get_mute_role(self, guild):
+        """
+        Get the Muted role for a guild, using the per-guild role id cache.
+
+        Args:
+            guild (discord.Guild): The guild to look up.
+
+        Returns:
+            discord.Role or None: The Muted role if it exists.
+        """
+        role_id = self._mute_role_cache.get(guild.id)
+        if role_id is not None:
+            role = guild.get_role(role_id)
+            if role is not None:
+                return role
+            del self._mute_role_cache[guild.id]
+
+        role = discord.utils.get(guild.roles, name="Muted")
+        if role is not None:
+            self._mute_role_cache[guild.id] = role.id
+        return role
+
+    def _resolve_announce_channel(self, guild):
+        """
+        Get the announcement channel for a guild, using the per-guild channel id cache.
+
+        Args:
+            guild (discord.Guild): The guild to look up.
+
+        Returns:
+            discord.TextChannel or None: The announcement channel if it exists.
+        """
+        channel_id = self._announce_channel_cache.get(guild.id)
+        if channel_id is not None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is not None:
+                return channel
+            del self._announce_channel_cache[guild.id]
+
+        channel = discord.utils.get(guild.text_channels, name=self._announce_channel_name)
+        if channel is not None:
+            self._announce_channel_cache[guild.id] = channel.id
+        return channel
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Invalidate the cached announcement channel when it is deleted."""
+        if self._announce_channel_cache.get(channel.guild.id) == channel.id:
+            del self._announce_channel_cache[channel.guild.id]
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Invalidate the cached announcement channel when a channel is renamed to or from its name."""
+        if before.name != after.name and self._announce_channel_name in (before.name, after.name):
+            self._announce_channel_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        """Invalidate the cached Muted role when it is deleted."""
+        if self._mute_role_cache.get(role.guild.id) == role.id:
+            del self._mute_role_cache[role.guild.id]
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        """Invalidate the cached Muted role when a role is renamed to or from "Muted"."""
+        if before.name != after.name and "Muted" in (before.name, after.name):
+            self._mute_role_cache.pop(after.guild.id, None)
+
+    async def _do(self, ctx, coro_factory, *, action: str, target) -> bool:
+        """
+        Run a moderation action with shared error handling.
+
+        Args:
+            ctx (commands.Context): The invocation context.
+            coro_factory (Callable): Zero-argument callable returning the coroutine to await.
+            action (str): The action name used in log and reply messages (e.g., "kick").
+            target: The member the action is applied to.
+
+        Returns:
+            bool: True if the action succeeded, False if the bot lacked permission.
+
+        Raises:
+            CommandError: If the action fails for any other reason.
+        """
+        try:
+            await coro_factory()
+            return True
+        except discord.Forbidden:
+            self.logger.error("Permission error while trying to %s %s.", action, target)
+            await ctx.send(_NO_PERM_TMPL.format(action))
+            return False
+        except discord.HTTPException as e:
+            self.logger.error("Error trying to %s member %s: %s", action, target, e, exc_info=e)
+            raise CommandError(_ERR_TMPL.format(action, target))
+
+    async def _moderate(self, ctx, action: str, members, reason: str = None):
+        """
+        Apply a moderation action from `_ACTIONS` to one or more members.
+
+        For kick and ban, the invoking user and the bot itself are skipped and named
+        in a reply. A single target keeps the
+        single-member behaviour of `_do`; several targets are handled concurrently
+        and reported with one aggregated reply.
+
+        Args:
+            ctx (commands.Context): The invocation context.
+            action (str): The key of the action in `_ACTIONS` (e.g., "kick").
+            members (list): The members the action is applied to.
+            reason (str, optional): The reason for the action.
+        """
+        past, suffix, skip_self, factory = _ACTIONS[action]
+        guild = ctx.guild
+        targets = list(members)
+        skipped = [m for m in targets if m == guild.me or m == ctx.author] if skip_self else []
+        if skipped:
+            targets = [m for m in targets if m not in skipped]
+            await ctx.send(f"Skipped {', '.join(map(str, skipped))}: you can't {action} yourself or the bot.")
+        if not targets:
+            if not skipped:
+                await ctx.send(f"No valid members to {action}.")
+            return
+
+        if len(targets) == 1:
+            member = targets[0]
+            if await self._do(ctx, lambda: factory(self, guild, member, reason), action=action, target=member):
+                await ctx.send(f"{member} has been {past}{suffix}.")
+                self.logger.info("%s %s %s | Reason: %s", ctx.author, past, member, reason)
+            return
+
+        results = await asyncio.gather(*(factory(self, guild, m, reason) for m in targets), return_exceptions=True)
+        succeeded = 0
+        for member, result in zip(targets, results):
+            if isinstance(result, discord.Forbidden):
+                self.logger.error("Permission error while trying to %s %s.", action, member)
+            elif isinstance(result, discord.HTTPException):
+                self.logger.error("Error trying to %s member %s: %s", action, member, result, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                succeeded += 1
+                self.logger.info("%s %s %s | Reason: %s", ctx.author, past, member, reason)
+
+        failed = len(targets) - succeeded
+        summary = f"{succeeded} member(s) have been {past}{suffix}."
+        if failed:
+            summary += f" Failed to {action} {failed} member(s)."
+        await ctx.send(summary)
+
+    async def _apply_mute(self, guild, member, reason):
+        """
+        Add the Muted role to a member, creating and configuring the role if needed.
+
+        Args:
+            guild (discord.Guild): The guild the member belongs to.
+            member (discord.Member): The member to mute.
+            reason (str, optional): The reason for muting.
+        """
+        mute_role = self._get_mute_role(guild)
+        if not mute_role:
+            # Create a Muted role if it doesn't exist
+            mute_role = await guild.create_role(name="Muted")
+            self._mute_role_cache[guild.id] = mute_role.id
+            self.logger.debug("Muted role created.")
+
+            # Set permissions for the role in every channel concurrently
+            mute_overwrite = discord.PermissionOverwrite(
+                speak=False, send_messages=False, read_message_history=True, read_messages=False
+            )
+            channels = list(guild.channels)
+            results = await asyncio.gather(*[
+                channel.set_permissions(mute_role, overwrite=mute_overwrite, reason="Muted role setup")
+                for channel in channels
+            ], return_exceptions=True)
+            for channel, result in zip(channels, results):
+                if isinstance(result, discord.HTTPException):
+                    self.logger.error("Failed to set permissions for Muted role in channel %s: %s", channel.name, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self.logger.debug("Permissions set for Muted role in channel: %s", channel.name)
+
+        await member.add_roles(mute_role, reason=reason)
 
     @commands.command(name='kick')
     @commands.has_permissions(kick_members=True)
-    async def kick_member(self, ctx, member: discord.Member, *, reason: str = None):
+    async def kick_member(self, ctx, members: commands.Greedy[discord.Member], *, reason: str = None):
         """
-        Kick a member from the server.
+        Kick one or more members from the server.
 
         Usage:
-            !kick @member [reason]
+            !kick @member [@member ...] [reason]
 
         Args:
             ctx (commands.Context): The invocation context.
-            member (discord.Member): The member to kick.
+            members (list[discord.Member]): The members to kick.
             reason (str, optional): The reason for kicking.
         """
-        try:
-            await member.kick(reason=reason)
-            await ctx.send(f"{member} has been kicked from the server.")
-            self.logger.info(f"{ctx.author} kicked {member} | Reason: {reason}")
-        except discord.Forbidden:
-            self.logger.error(f"Permission error while trying to kick {member}.")
-            await ctx.send("I don't have permission to kick that user.")
-        except Exception as e:
-            self.logger.error(f"Error kicking member: {e}", exc_info=True)
-            raise CommandError(f"An error occurred while trying to kick {member}.")
+        await self._moderate(ctx, 'kick', members, reason)
 
     @commands.command(name='ban')
     @commands.has_permissions(ban_members=True)
-    async def ban_member(self, ctx, member: discord.Member, *, reason: str = None):
+    async def ban_member(self, ctx, members: commands.Greedy[discord.Member], *, reason: str = None):
         """
-        Ban a member from the server.
+        Ban one or more members from the server.
 
         Usage:
-            !ban @member [reason]
+            !ban @member [@member ...] [reason]
 
         Args:
             ctx (commands.Context): The invocation context.
-            member (discord.Member): The member to ban.
+            members (list[discord.Member]): The members to ban.
             reason (str, optional): The reason for banning.
         """
-        try:
-            await member.ban(reason=reason)
-            await ctx.send(f"{member} has been banned from the server.")
-            self.logger.info(f"{ctx.author} banned {member} | Reason: {reason}")
-        except discord.Forbidden:
-            self.logger.error(f"Permission error while trying to ban {member}.")
-            await ctx.send("I don't have permission to ban that user.")
-        except Exception as e:
-            self.logger.error(f"Error banning member: {e}", exc_info=True)
-            raise CommandError(f"An error occurred while trying to ban {member}.")
+        await self._moderate(ctx, 'ban', members, reason)
 
     @commands.command(name='unban')
     @commands.has_permissions(ban_members=True)
@@ -87,27 +277,44 @@ class AdminCommands(commands.Cog):
 
         Usage:
             !unban username#discriminator
+            !unban <user_id>
 
         Args:
             ctx (commands.Context): The invocation context.
-            user_name (str): The full username and discriminator (e.g., User#1234).
+            user_name (str): The full username and discriminator (e.g., User#1234), or a user ID.
         """
         try:
-            banned_users = await ctx.guild.bans()
-            user_name, user_discriminator = user_name.split('#')
-
-            for ban_entry in banned_users:
+            if user_name.isdigit():
+                # Direct lookup by ID instead of scanning the ban list
+                try:
+                    ban_entry = await ctx.guild.fetch_ban(discord.Object(id=int(user_name)))
+                except discord.NotFound:
+                    await ctx.send(f"User with ID {user_name} not found in banned users.")
+                    return
+                await ctx.guild.unban(ban_entry.user)
+                await ctx.send(f"Unbanned {ban_entry.user.mention}.")
+                self.logger.info("%s unbanned %s.", ctx.author, ban_entry.user)
+                return
+
+            user_name, sep, user_discriminator = user_name.rpartition('#')
+            if not sep:
+                await ctx.send("Usage: !unban username#discriminator or !unban <user_id>")
+                return
+            target = (user_name, user_discriminator)
+
+            # Stream the ban list and stop at the first match
+            async for ban_entry in ctx.guild.bans(limit=None):
                 user = ban_entry.user
-                if (user.name, user.discriminator) == (user_name, user_discriminator):
+                if (user.name, user.discriminator) == target:
                     await ctx.guild.unban(user)
                     await ctx.send(f"Unbanned {user.mention}.")
-                    self.logger.info(f"{ctx.author} unbanned {user}.")
+                    self.logger.info("%s unbanned %s.", ctx.author, user)
                     return
 
             await ctx.send(f"User {user_name}#{user_discriminator} not found in banned users.")
-        except Exception as e:
-            self.logger.error(f"Error unbanning member: {e}", exc_info=True)
-            raise CommandError("An error occurred while trying to unban the user.")
+        except discord.HTTPException as e:
+            self.logger.error("Error unbanning member: %s", e, exc_info=e)
+            raise CommandError(_ERR_TMPL.format('unban', 'the user'))
 
     @commands.command(name='mute')
     @commands.has_permissions(manage_roles=True)
@@ -123,27 +330,7 @@ class AdminCommands(commands.Cog):
             member (discord.Member): The member to mute.
             reason (str, optional): The reason for muting.
         """
-        try:
-            mute_role = discord.utils.get(ctx.guild.roles, name="Muted")
-            if not mute_role:
-                # Create a Muted role if it doesn't exist
-                mute_role = await ctx.guild.create_role(name="Muted")
-                self.logger.debug("Muted role created.")
-
-                # Set permissions for the role in each channel
-                for channel in ctx.guild.channels:
-                    await channel.set_permissions(mute_role, speak=False, send_messages=False, read_message_history=True, read_messages=False)
-                    self.logger.debug(f"Permissions set for Muted role in channel: {channel.name}")
-
-            await member.add_roles(mute_role, reason=reason)
-            await ctx.send(f"{member} has been muted.")
-            self.logger.info(f"{ctx.author} muted {member} | Reason: {reason}")
-        except discord.Forbidden:
-            self.logger.error(f"Permission error while trying to mute {member}.")
-            await ctx.send("I don't have permission to mute that user.")
-        except Exception as e:
-            self.logger.error(f"Error muting member: {e}", exc_info=True)
-            raise CommandError(f"An error occurred while trying to mute {member}.")
+        await self._moderate(ctx, 'mute', [member], reason)
 
     @commands.command(name='unmute')
     @commands.has_permissions(manage_roles=True)
@@ -158,23 +345,16 @@ class AdminCommands(commands.Cog):
             ctx (commands.Context): The invocation context.
             member (discord.Member): The member to unmute.
         """
-        try:
-            mute_role = discord.utils.get(ctx.guild.roles, name="Muted")
-            if mute_role in member.roles:
-                await member.remove_roles(mute_role)
-                await ctx.send(f"{member} has been unmuted.")
-                self.logger.info(f"{ctx.author} unmuted {member}.")
-            else:
-                await ctx.send(f"{member} is not muted.")
-        except discord.Forbidden:
-            self.logger.error(f"Permission error while trying to unmute {member}.")
-            await ctx.send("I don't have permission to unmute that user.")
-        except Exception as e:
-            self.logger.error(f"Error unmuting member: {e}", exc_info=True)
-            raise CommandError(f"An error occurred while trying to unmute {member}.")
+        mute_role = self._get_mute_role(ctx.guild)
+        if mute_role is None or member.get_role(mute_role.id) is None:
+            await ctx.send(f"{member} is not muted.")
+            return
+
+        await self._moderate(ctx, 'unmute', [member])
 
     @commands.command(name='clear')
     @commands.has_permissions(manage_messages=True)
+    @commands.cooldown(1, 5.0, BucketType.channel)
     async def clear_messages(self, ctx, amount: int):
         """
         Clear a number of messages in the current channel.
@@ -187,18 +367,29 @@ class AdminCommands(commands.Cog):
             amount (int): The number of messages to delete.
         """
         try:
-            deleted = await ctx.channel.purge(limit=amount+1)  # Include the command message
-            await ctx.send(f"Deleted {len(deleted)-1} messages.", delete_after=5)
-            self.logger.info(f"{ctx.author} cleared {len(deleted)-1} messages in {ctx.channel}.")
+            messages = [m async for m in ctx.channel.history(limit=amount+1)]  # Include the command message
+            # The bulk endpoint only accepts messages younger than 14 days, at most 100 per request
+            bulk_cutoff = discord.utils.utcnow() - timedelta(days=BULK_DELETE_MAX_AGE_DAYS)
+            recent = [m for m in messages if m.created_at > bulk_cutoff]
+            old = [m for m in messages if m.created_at <= bulk_cutoff]
+            await asyncio.gather(*[
+                ctx.channel.delete_messages(recent[i:i+100])
+                for i in range(0, len(recent), 100)
+            ])
+            for message in old:
+                await message.delete()
+            await ctx.send(f"Deleted {len(messages)-1} messages.", delete_after=5)
+            self.logger.info("%s cleared %s messages in %s.", ctx.author, len(messages)-1, ctx.channel)
         except discord.Forbidden:
             self.logger.error("Permission error while trying to clear messages.")
             await ctx.send("I don't have permission to delete messages.")
-        except Exception as e:
-            self.logger.error(f"Error clearing messages: {e}", exc_info=True)
+        except discord.HTTPException as e:
+            self.logger.error("Error clearing messages: %s", e, exc_info=e)
             raise CommandError("An error occurred while trying to clear messages.")
 
     @commands.command(name='announce')
     @commands.has_permissions(administrator=True)
+    @commands.cooldown(1, 10.0, BucketType.guild)
     async def make_announcement(self, ctx, *, message: str):
         """
         Make an announcement in the announcement channel.
@@ -211,18 +402,37 @@ class AdminCommands(commands.Cog):
             message (str): The announcement message.
         """
         try:
-            announcement_channel_name = getattr(self.bot.config.bot, 'announcement_channel', 'announcements')
-            channel = discord.utils.get(ctx.guild.text_channels, name=announcement_channel_name)
+            channel = self._resolve_announce_channel(ctx.guild)
             if channel:
                 await channel.send(message)
                 await ctx.send("Announcement sent.")
-                self.logger.info(f"{ctx.author} made an announcement: {message}")
+                self.logger.info("%s made an announcement: %s", ctx.author, message)
             else:
-                await ctx.send(f"Announcement channel '{announcement_channel_name}' not found.")
-        except Exception as e:
-            self.logger.error(f"Error making announcement: {e}", exc_info=True)
+                await ctx.send(f"Announcement channel '{self._announce_channel_name}' not found.")
+        except discord.HTTPException as e:
+            self.logger.error("Error making announcement: %s", e, exc_info=e)
             raise CommandError("An error occurred while trying to make an announcement.")
 
+    async def cog_command_error(self, ctx, error):
+        """
+        Error handler for commands in this cog.
+
+        Args:
+            ctx (commands.Context): The invocation context.
+            error (Exception): The error that occurred.
+        """
+        if isinstance(error, commands.CommandOnCooldown):
+            await ctx.send(f"Command is on cooldown. Try again after {error.retry_after:.2f} seconds.")
+        elif isinstance(error, commands.MissingPermissions):
+            await ctx.send("You don't have the required permissions to use this command.")
+        elif isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send("Missing arguments for the command.")
+        elif isinstance(error, commands.BadArgument):
+            await ctx.send("Invalid argument provided.")
+        else:
+            await ctx.send("An error occurred while processing the command.")
+            self.logger.error("Error in admin command %s: %s", ctx.command, error, exc_info=error)
+
 async def setup(bot):
     """Asynchronous setup for the AdminCommands cog."""
     await bot.add_cog(AdminCommands(bot))
\ No newline at end of file
@@ -8,20 +8,79 @@ import re
 import sqlite3
 import time
 import asyncio
-from typing import List, Dict
+import functools
+from datetime import timedelta
+import math
+import pathlib
+import tempfile
+import shutil
+import contextlib
+from typing import List, Dict, Optional
 
 from utils.custom_exceptions import ThreadManagementError
 from utils.metrics import MetricsCollector
 from utils.config_manager import ConfigManager
 
 # NLP and Phonetic Libraries
-import nltk
 from nltk.stem import PorterStemmer
-import enchant  # For dictionary lookup
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import json
 
-nltk.download('punkt', quiet=True)
+try:
+    import orjson  # Faster JSON parsing for the training data, if available
+except ImportError:
+    orjson = None
+
+# Word tokens, keeping in-word apostrophes (e.g. "don't")
+_TOKEN_RE = re.compile(r"[\w']+", re.UNICODE)
+
+# Any letter (a word character that isn't a digit or underscore)
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# Discord's bulk delete endpoint rejects messages older than this
+BULK_DELETE_MAX_AGE_DAYS = 14
+
+# Embed color for infraction announcements (discord.Color.orange())
+INFRACTION_EMBED_COLOR = 0xE67E22
+
+# Maximum number of expired infractions handled per sweep; the next sweep picks up the rest
+SWEEP_BATCH_LIMIT = 500
+
+# Infractions are flushed as soon as this many are queued, or by the periodic flush
+INFRACTION_BATCH_SIZE = 50
+
+# Upper bound on queued infractions; the oldest are dropped if the database falls behind
+INFRACTION_BUFFER_MAX = 10_000
+
+_INSERT_INFRACTION_SQL = '''
+    INSERT INTO infractions (message_id, channel_id, user_id, timestamp, deletion_time, content)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# Number of most significant tokens combined by the Bayesian filter
+SPAM_SIGNIFICANT_TOKENS = 15
+
+# Soundex byte translation table: letters map to their digit, everything else to '0'
+_SOUNDEX_LUT = bytearray(b'0' * 256)
+for _digit, _letters in enumerate((b"BFPV", b"CGJKQSXZ", b"DT", b"L", b"MN", b"R"), 1):
+    for _letter in _letters:
+        _SOUNDEX_LUT[_letter] = ord(str(_digit))
+_SOUNDEX_LUT = bytes(_SOUNDEX_LUT)
+_SOUNDEX_RUNS_RE = re.compile(rb'(.)\1+', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _soundex(word: str) -> str:
+    """Memoized Soundex; chat vocabulary is repetitive, so most tokens are cache hits."""
+    word = word.upper()
+    # Non-ASCII characters become '?', which the table maps to '0' like any other non-letter
+    encoded = word.encode('ascii', 'replace')
+    digits = encoded[:1] + encoded[1:].translate(_SOUNDEX_LUT)
+    # Collapse adjacent duplicate codes, then keep the original first letter
+    collapsed = _SOUNDEX_RUNS_RE.sub(rb'\1', digits).decode('ascii')
+    soundex_code = (word[0] + collapsed[1:]).replace('0', '')
+    return (soundex_code + '0000')[:4]
 
 class Censorship(commands.Cog):
     """
@@ -46,39 +105,61 @@ class Censorship(commands.Cog):
         # Set the deletion delay (in seconds) with default
         self.delay = getattr(self.config.censorship, 'deletion_delay', 6) * 3600  # Default to 6 hours
 
-        # Admin channel ID from config
+        self._delay_hours_str = f"In {self.delay / 3600} hours"
+
+        # Admin channel ID from config; the channel object is resolved lazily and cached
         self.admin_channel_id = getattr(self.config.discord, 'admin_channel_id', None)
+        self._admin_channel = None
 
         # Load banned words and exceptions
         self.banned_words = set()
+        self.banned_stems = set()
         self.exceptions = set()
+        self.banned_pattern = None
         asyncio.create_task(self.load_banned_words())
 
-        # Initialize NLP components
-        self.ps = PorterStemmer()
-        self.dictionary = enchant.Dict("en_US")
-
         # Phonetic mapping using Soundex algorithm
         self.soundex_codes = {}
+        self.banned_soundex = set()
 
         # Initialize Bayesian filter data
-        self.ham_counts = defaultdict(int)
-        self.spam_counts = defaultdict(int)
+        self.ham_counts = {}
+        self.spam_counts = {}
         self.total_ham = 0
         self.total_spam = 0
+        self.log_ratios = {}
+        self.default_log_ratio = 0.0
         self.load_training_data()
 
-        # Set up the SQLite database for infractions
-        self.setup_database()
+        # Set up the SQLite database for infractions. All database work runs on a single
+        # dedicated thread that owns the connection, keeping disk I/O off the event loop.
+        self._pending_infractions = deque(maxlen=INFRACTION_BUFFER_MAX)
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='infractions-db')
+        self._db_executor.submit(self.setup_database)
 
-        # Start the background task for deleting expired messages
+        # Start the background tasks for flushing infractions and deleting expired messages
+        self.flush_infractions.start()
         self.delete_expired_messages.start()
 
     def cog_unload(self):
         """Cancel the background tasks and close the database when the cog is unloaded."""
+        self.flush_infractions.cancel()
         self.delete_expired_messages.cancel()
-        if hasattr(self, 'conn'):
-            self.conn.close()
+        pending = self._take_pending_infractions()
+        if pending:
+            self._db_executor.submit(self._write_infractions, pending)
+        self._db_executor.submit(self._close_database)
+        self._db_executor.shutdown(wait=False)
+
+    @functools.cached_property
+    def ps(self) -> PorterStemmer:
+        """The Porter stemmer, created on first use."""
+        return PorterStemmer()
+
+    @functools.cached_property
+    def _stem(self):
+        """Memoized `ps.stem`; chat vocabulary is highly repetitive."""
+        return functools.lru_cache(maxsize=50000)(self.ps.stem)
 
     async def load_banned_words(self):
         """
@@ -98,17 +179,28 @@ class Censorship(commands.Cog):
             # Remove exceptions from banned words
             self.banned_words -= self.exceptions
 
-            # Create Soundex codes
-            self.soundex_codes = self.create_soundex_codes(self.banned_words)
+            self._rebuild_banned_matchers()
 
             self.logger.info(f"Loaded {len(self.banned_words)} banned words and {len(self.exceptions)} exceptions.")
 
         except Exception as e:
             self.logger.error(f"Failed to load banned words: {e}", exc_info=True)
 
+    def _rebuild_banned_matchers(self):
+        """Rebuild the banned stems, Soundex index and compiled pattern from `banned_words`."""
+        # Stem the banned corpus once so message stems can be compared directly
+        self.banned_stems = {self._stem(word) for word in self.banned_words}
+
+        # Reverse index of banned Soundex codes for O(1) phonetic lookups
+        self.soundex_codes = self.create_soundex_codes(self.banned_words)
+        self.banned_soundex = set(self.soundex_codes.values())
+
+        # Compile a single matcher for whole-word and phrase hits
+        self.banned_pattern = self.compile_banned_pattern(self.banned_words)
+
     async def load_words_from_file(self, file_path: str) -> set:
         """
-        Load words from a file asynchronously.
+        Load words from a file in a worker thread.
 
         Args:
             file_path (str): The path to the file.
@@ -116,17 +208,34 @@ class Censorship(commands.Cog):
         Returns:
             set: A set of words loaded from the file.
         """
-        words = set()
-        if os.path.exists(file_path):
-            from aiofile import async_open
-            async with async_open(file_path, 'r', encoding='utf-8') as f:
-                async for line in f:
-                    word = line.strip()
-                    if word and not word.startswith('#'):
-                        words.add(word.lower())
-        else:
+        if not os.path.exists(file_path):
             self.logger.warning(f"File not found: {file_path}")
-        return words
+            return set()
+        return await asyncio.to_thread(self._read_words, file_path)
+
+    @staticmethod
+    def _read_words(file_path: str) -> set:
+        """Read a word list file, skipping blank lines and comments. Runs in a worker thread."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            stripped = (line.strip() for line in f)
+            return {word.lower() for word in stripped if word and not word.startswith('#')}
+
+    def compile_banned_pattern(self, words: set) -> Optional[re.Pattern]:
+        """
+        Compile banned words into a single whole-word regular expression.
+
+        Longer entries are tried first so multi-word phrases win over their prefixes.
+
+        Args:
+            words (set): Set of banned words and phrases.
+
+        Returns:
+            re.Pattern or None: The compiled pattern, or None if there are no words.
+        """
+        if not words:
+            return None
+        alternation = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+        return re.compile(rf'\b(?:{alternation})\b')
 
     def create_soundex_codes(self, words: set) -> Dict[str, str]:
         """
@@ -138,11 +247,7 @@ class Censorship(commands.Cog):
         Returns:
             dict: Mapping of words to their Soundex codes.
         """
-        soundex_mapping = {}
-        for word in words:
-            code = self.soundex(word)
-            soundex_mapping[word] = code
-        return soundex_mapping
+        return {word: _soundex(word) for word in words}
 
     def soundex(self, word: str) -> str:
         """
@@ -154,22 +259,7 @@ class Censorship(commands.Cog):
         Returns:
             str: The Soundex code.
         """
-        word = word.upper()
-        codes = ("BFPV", "CGJKQSXZ", "DT", "L", "MN", "R")
-        soundex_dict = {}
-        for code, letters in enumerate(codes, 1):
-            for letter in letters:
-                soundex_dict[letter] = str(code)
-
-        soundex_code = [word[0]]
-        for char in word[1:]:
-            digit = soundex_dict.get(char, '0')
-            if digit != soundex_code[-1]:
-                soundex_code.append(digit)
-
-        soundex_code = ''.join(soundex_code).replace('0', '')
-        soundex_code = (soundex_code + '0000')[:4]
-        return soundex_code
+        return _soundex(word)
 
     def load_training_data(self):
         """
@@ -178,29 +268,57 @@ class Censorship(commands.Cog):
         try:
             data_file = os.path.join('data', 'training_data.json')
             if os.path.exists(data_file):
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.ham_counts = defaultdict(int, data.get('ham_counts', {}))
-                    self.spam_counts = defaultdict(int, data.get('spam_counts', {}))
-                    self.total_ham = data.get('total_ham', 0)
-                    self.total_spam = data.get('total_spam', 0)
-                    self.logger.info("Loaded training data for Bayesian filtering.")
+                raw = pathlib.Path(data_file).read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                # Counts are only read when building the log ratios, so plain dicts suffice
+                self.ham_counts = dict(data.get('ham_counts', {}))
+                self.spam_counts = dict(data.get('spam_counts', {}))
+                self.total_ham = data.get('total_ham', 0)
+                self.total_spam = data.get('total_spam', 0)
+                self.logger.info("Loaded training data for Bayesian filtering.")
             else:
                 self.logger.warning(f"Training data file {data_file} not found. Starting with empty data.")
 
         except Exception as e:
             self.logger.error(f"Error loading training data: {e}", exc_info=True)
 
+        self.build_log_ratios()
+
+    def build_log_ratios(self):
+        """
+        Precompute the per-token spam/ham log-likelihood ratios used by the Bayesian filter.
+
+        Token probabilities use Laplace smoothing; unseen tokens use `default_log_ratio`.
+        """
+        log_spam_total = math.log(self.total_spam + 2)
+        log_ham_total = math.log(self.total_ham + 2)
+        self.default_log_ratio = log_ham_total - log_spam_total
+        self.log_ratios = {
+            token: (math.log(self.spam_counts.get(token, 0) + 1) - log_spam_total)
+                   - (math.log(self.ham_counts.get(token, 0) + 1) - log_ham_total)
+            for token in set(self.spam_counts) | set(self.ham_counts)
+        }
+
     def setup_database(self):
-        """Set up the SQLite database for storing infractions."""
+        """
+        Set up the SQLite database for storing infractions.
+
+        Runs on the database thread, which owns the connection.
+        """
         try:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))
             db_path = os.path.join(project_root, 'data', 'infractions.db')
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
-            self.conn = sqlite3.connect(db_path)
-            self.cursor = self.conn.cursor()
-            self.cursor.execute('''
+            # Autocommit mode with explicit transactions; keep the hot statements prepared
+            self.conn = sqlite3.connect(db_path, cached_statements=128, isolation_level=None)
+            self.conn.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+            ''')
+            self.conn.execute('''
                 CREATE TABLE IF NOT EXISTS infractions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     message_id TEXT NOT NULL,
@@ -211,11 +329,34 @@ class Censorship(commands.Cog):
                     content TEXT NOT NULL
                 )
             ''')
-            self.conn.commit()
+            # Lets the expiry sweep use a range scan instead of reading the whole table
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_infractions_deletion ON infractions(deletion_time)')
+            self.conn.execute('PRAGMA optimize')
             self.logger.info("Infractions database setup completed.")
         except Exception as e:
             self.logger.error(f"Failed to set up infractions database: {e}", exc_info=True)
 
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in one explicit transaction. Runs on the database thread."""
+        self.conn.execute('BEGIN')
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+
+    def _close_database(self):
+        """Close the database connection. Runs on the database thread."""
+        if hasattr(self, 'conn'):
+            self.conn.close()
+
+    async def _run_db(self, func, *args):
+        """Run a database function on the database thread and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, func, *args)
+
     @commands.Cog.listener()
     async def on_message(self, message):
         """
@@ -230,6 +371,11 @@ class Censorship(commands.Cog):
         if message.author.bot:
             return
 
+        # Skip emoji-only noise and short acks without scanning
+        content = message.content
+        if len(content) < 2 or not _LETTER_RE.search(content):
+            return
+
         # Log that on_message is triggered
         self.logger.debug(f"Processing message ID {message.id} from {message.author} in channel {message.channel}.")
 
@@ -241,22 +387,12 @@ class Censorship(commands.Cog):
                 # Schedule the message for deletion
                 deletion_time = time.time() + self.delay
                 self.store_infraction(message, deletion_time)
+                if len(self._pending_infractions) >= INFRACTION_BATCH_SIZE:
+                    await self._flush_pending_infractions()
 
-                # Announce the infraction in the admin channel
+                # Announce the infraction in the admin channel; deletion is handled by delete_expired_messages
                 await self.announce_infraction(message)
 
-                # Optionally schedule deletion after delay
-                await asyncio.sleep(self.delay)
-                try:
-                    await message.delete()
-                    self.logger.info(f"Deleted message ID {message.id} from {message.author}.")
-                except discord.Forbidden:
-                    self.logger.error(f"Missing permissions to delete message ID {message.id}.")
-                except discord.NotFound:
-                    self.logger.warning(f"Message ID {message.id} not found. It might have been deleted already.")
-                except Exception as e:
-                    self.logger.error(f"Error deleting message ID {message.id}: {e}", exc_info=True)
-
         except Exception as e:
             self.logger.error(f"Error handling message ID {message.id}: {e}", exc_info=True)
 
@@ -270,21 +406,27 @@ class Censorship(commands.Cog):
         Returns:
             bool: True if inappropriate, False otherwise.
         """
+        # Match banned words and phrases in a single scan of the message
+        if self.banned_pattern is not None:
+            match = self.banned_pattern.search(content)
+            if match:
+                self.logger.debug(f"Content matches banned word '{match.group(0)}'.")
+                return True
+
         tokens = self.tokenize(content)
-        stemmed_tokens = [self.ps.stem(token) for token in tokens]
 
         # Check against banned words using stemming
-        for token in stemmed_tokens:
-            if token in self.banned_words:
-                self.logger.debug(f"Token '{token}' found in banned words.")
-                return True
+        stem = self._stem
+        stem_hits = {stem(token) for token in tokens} & self.banned_stems
+        if stem_hits:
+            self.logger.debug(f"Token '{next(iter(stem_hits))}' found in banned words.")
+            return True
 
         # Check using phonetic matching
-        for token in tokens:
-            soundex_code = self.soundex(token)
-            if soundex_code in self.soundex_codes.values():
-                self.logger.debug(f"Token '{token}' matches banned words phonetically.")
-                return True
+        soundex_hits = {_soundex(token) for token in tokens} & self.banned_soundex
+        if soundex_hits:
+            self.logger.debug(f"Soundex code '{next(iter(soundex_hits))}' matches banned words phonetically.")
+            return True
 
         # Check using Bayesian filter
         spam_probability = self.calculate_spam_probability(tokens)
@@ -304,58 +446,117 @@ class Censorship(commands.Cog):
         Returns:
             list: List of tokens.
         """
-        # Use NLTK's word tokenizer
-        tokens = nltk.word_tokenize(text)
-        return tokens
+        return _TOKEN_RE.findall(text)
 
     def calculate_spam_probability(self, tokens: List[str]) -> float:
         """
         Calculate the probability that a message is spam using Bayesian filtering.
 
+        Scores are summed in log space over the most significant tokens, so long
+        messages don't underflow.
+
         Args:
             tokens (list): List of tokens from the message.
 
         Returns:
             float: Spam probability.
         """
-        spam_likelihood = ham_likelihood = 1.0
+        log_ratios = self.log_ratios
+        default = self.default_log_ratio
+        scores = [log_ratios.get(token, default) for token in tokens]
+        scores.sort(key=abs, reverse=True)
+        score = sum(scores[:SPAM_SIGNIFICANT_TOKENS])
 
-        for token in tokens:
-            spam_count = self.spam_counts.get(token, 0.0)
-            ham_count = self.ham_counts.get(token, 0.0)
+        # Logistic function, clamped to keep math.exp in range
+        score = max(-700.0, min(700.0, score))
+        return 1.0 / (1.0 + math.exp(-score))
 
-            # Apply Laplace smoothing
-            p_token_spam = (spam_count + 1) / (self.total_spam + 2)
-            p_token_ham = (ham_count + 1) / (self.total_ham + 2)
+    def store_infraction(self, message, deletion_time):
+        """
+        Queue the infraction for storage in the database.
 
-            spam_likelihood *= p_token_spam
-            ham_likelihood *= p_token_ham
+        Infractions are buffered and written in batches by the `flush_infractions` task.
+        """
+        self._pending_infractions.append((
+            str(message.id),
+            str(message.channel.id),
+            str(message.author.id),
+            message.created_at.timestamp(),
+            deletion_time,
+            message.content,
+        ))
+        self.logger.info(f"Queued infraction for message ID {message.id} by user {message.author}.")
+
+    def _write_infractions(self, pending: list) -> bool:
+        """
+        Write a batch of infractions to the database in a single transaction.
 
-        # Avoid division by zero
-        if spam_likelihood + ham_likelihood == 0:
-            return 0.0
+        Runs on the database thread.
 
-        spam_probability = spam_likelihood / (spam_likelihood + ham_likelihood)
-        return spam_probability
+        Args:
+            pending (list): Infraction rows to insert.
 
-    def store_infraction(self, message, deletion_time):
-        """Store the infraction in the database."""
+        Returns:
+            bool: True if the batch was stored, False otherwise.
+        """
         try:
-            self.cursor.execute('''
-                INSERT INTO infractions (message_id, channel_id, user_id, timestamp, deletion_time, content)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                str(message.id),
-                str(message.channel.id),
-                str(message.author.id),
-                message.created_at.timestamp(),
-                deletion_time,
-                message.content,
-            ))
-            self.conn.commit()
-            self.logger.info(f"Stored infraction for message ID {message.id} by user {message.author}.")
+            with self._transaction() as conn:
+                conn.executemany(_INSERT_INFRACTION_SQL, pending)
+            self.logger.info(f"Stored {len(pending)} infraction(s).")
+            return True
         except Exception as e:
-            self.logger.error(f"Error storing infraction for message ID {message.id}: {e}", exc_info=True)
+            self.logger.error(f"Error storing {len(pending)} infraction(s): {e}", exc_info=True)
+            return False
+
+    def _fetch_expired_infractions(self, current_time: float) -> list:
+        """Return up to SWEEP_BATCH_LIMIT (id, message_id, channel_id) rows due for deletion. Runs on the database thread."""
+        return self.conn.execute('''
+            SELECT id, message_id, channel_id FROM infractions
+            WHERE deletion_time <= ?
+            ORDER BY deletion_time
+            LIMIT ?
+        ''', (current_time, SWEEP_BATCH_LIMIT)).fetchall()
+
+    def _delete_infractions(self, infraction_ids: list):
+        """Delete infractions by id in a single transaction. Runs on the database thread."""
+        with self._transaction() as conn:
+            conn.executemany('DELETE FROM infractions WHERE id = ?', infraction_ids)
+
+    def _take_pending_infractions(self) -> list:
+        """Drain the infraction buffer and return its rows in insertion order."""
+        pending = list(self._pending_infractions)
+        self._pending_infractions.clear()
+        return pending
+
+    async def _flush_pending_infractions(self):
+        """Write all buffered infractions to the database in one batch."""
+        pending = self._take_pending_infractions()
+        if not pending:
+            return
+        if not await self._run_db(self._write_infractions, pending):
+            # Keep the batch so the next flush can retry it
+            self._pending_infractions.extendleft(reversed(pending))
+
+    @tasks.loop(seconds=5)
+    async def flush_infractions(self):
+        """Periodically write buffered infractions to the database."""
+        await self._flush_pending_infractions()
+
+    def set_admin_channel(self, channel):
+        """
+        Update the channel infractions are announced in.
+
+        Args:
+            channel (discord.TextChannel): The new admin channel.
+        """
+        self.admin_channel_id = str(channel.id)
+        self._admin_channel = channel
+
+    def _get_admin_channel(self):
+        """Return the cached admin channel, resolving it from the configured ID if needed."""
+        if self._admin_channel is None:
+            self._admin_channel = self.bot.get_channel(int(self.admin_channel_id))
+        return self._admin_channel
 
     async def announce_infraction(self, message):
         """
@@ -371,19 +572,25 @@ class Censorship(commands.Cog):
                     self.logger.warning("Admin channel ID not set. Infraction not announced.")
                     return
 
-            admin_channel = self.bot.get_channel(int(self.admin_channel_id))
+            admin_channel = self._get_admin_channel()
             if admin_channel:
-                embed = discord.Embed(
-                    title="Recorded Infraction",
-                    color=discord.Color.orange(),
-                    timestamp=discord.utils.utcnow()
-                )
-                embed.add_field(name="User", value=f"{message.author} (ID: {message.author.id})", inline=False)
-                embed.add_field(name="Server", value=message.guild.name, inline=False)
-                embed.add_field(name="Channel", value=message.channel.mention, inline=False)
-                embed.add_field(name="Message Content", value=message.content, inline=False)
-                embed.add_field(name="Scheduled Deletion", value=f"In {self.delay / 3600} hours", inline=False)
-                await admin_channel.send(embed=embed)
+                embed = discord.Embed.from_dict({
+                    'title': "Recorded Infraction",
+                    'color': INFRACTION_EMBED_COLOR,
+                    'timestamp': discord.utils.utcnow().isoformat(),
+                    'fields': [
+                        {'name': "User", 'value': f"{message.author} (ID: {message.author.id})", 'inline': False},
+                        {'name': "Server", 'value': message.guild.name, 'inline': False},
+                        {'name': "Channel", 'value': message.channel.mention, 'inline': False},
+                        {'name': "Message Content", 'value': message.content, 'inline': False},
+                        {'name': "Scheduled Deletion", 'value': self._delay_hours_str, 'inline': False},
+                    ],
+                })
+                try:
+                    await admin_channel.send(embed=embed)
+                except discord.NotFound:
+                    self._admin_channel = None
+                    raise
                 self.logger.info(f"Announced infraction for message ID {message.id} in admin channel.")
             else:
                 self.logger.warning(f"Admin channel with ID {self.admin_channel_id} not found.")
@@ -394,36 +601,61 @@ class Censorship(commands.Cog):
     async def delete_expired_messages(self):
         """Delete messages whose scheduled deletion time has passed."""
         try:
-            current_time = time.time()
-            self.cursor.execute('''
-                SELECT id, message_id, channel_id FROM infractions WHERE deletion_time <= ?
-            ''', (current_time,))
-            rows = self.cursor.fetchall()
-
-            for row in rows:
-                infraction_id, message_id, channel_id = row
+            rows = await self._run_db(self._fetch_expired_infractions, time.time())
+            processed_ids = []
+
+            # Group expired messages by channel so they can be bulk deleted
+            by_channel = defaultdict(list)
+            for infraction_id, message_id, channel_id in rows:
+                by_channel[channel_id].append(int(message_id))
+                processed_ids.append((infraction_id,))
+
+            bulk_cutoff = discord.utils.utcnow() - timedelta(days=BULK_DELETE_MAX_AGE_DAYS)
+            for channel_id, message_ids in by_channel.items():
                 channel = self.bot.get_channel(int(channel_id))
-                if channel:
-                    try:
-                        message = await channel.fetch_message(int(message_id))
-                        await message.delete()
-                        self.logger.info(f"Deleted message ID {message_id} from channel ID {channel_id}.")
-                    except discord.NotFound:
-                        self.logger.warning(f"Message ID {message_id} not found. It might have been deleted already.")
-                    except discord.Forbidden:
-                        self.logger.error(f"Missing permissions to delete message ID {message_id} in channel ID {channel_id}.")
-                    except Exception as e:
-                        self.logger.error(f"Error deleting message ID {message_id}: {e}", exc_info=True)
-                else:
+                if not channel:
                     self.logger.warning(f"Channel ID {channel_id} not found.")
+                    continue
+
+                # The bulk endpoint only accepts messages younger than 14 days
+                recent, old = [], []
+                for message_id in message_ids:
+                    partial = channel.get_partial_message(message_id)
+                    (recent if partial.created_at > bulk_cutoff else old).append(partial)
 
-                # Remove the infraction from the database
-                self.cursor.execute('DELETE FROM infractions WHERE id = ?', (infraction_id,))
-                self.conn.commit()
+                for i in range(0, len(recent), 100):
+                    await self._delete_partial_messages(channel, recent[i:i + 100])
+                for partial in old:
+                    await self._delete_partial_messages(channel, [partial])
+
+            # Remove the processed infractions from the database in one transaction
+            if processed_ids:
+                await self._run_db(self._delete_infractions, processed_ids)
 
         except Exception as e:
             self.logger.error(f"Error deleting expired messages: {e}", exc_info=True)
 
+    async def _delete_partial_messages(self, channel, messages: list):
+        """
+        Delete up to 100 messages from a channel without fetching them first.
+
+        Args:
+            channel (discord.TextChannel): The channel the messages belong to.
+            messages (list): PartialMessage objects to delete.
+        """
+        try:
+            if len(messages) == 1:
+                await messages[0].delete()
+            else:
+                await channel.delete_messages(messages)
+            self.logger.info(f"Deleted {len(messages)} message(s) from channel ID {channel.id}.")
+        except discord.NotFound:
+            self.logger.warning(f"Message(s) in channel ID {channel.id} not found. They might have been deleted already.")
+        except discord.Forbidden:
+            self.logger.error(f"Missing permissions to delete messages in channel ID {channel.id}.")
+        except Exception as e:
+            self.logger.error(f"Error deleting messages in channel ID {channel.id}: {e}", exc_info=True)
+
     @delete_expired_messages.before_loop
     async def before_delete_expired_messages(self):
         """Wait for the bot to be ready before starting the deletion loop."""
@@ -469,9 +701,7 @@ class Censorship(commands.Cog):
             project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))
             banned_words_file = os.path.join(project_root, 'data', 'banned_words.txt')
 
-            from aiofile import async_open
-            async with async_open(banned_words_file, 'a', encoding='utf-8') as f:
-                await f.write(f"{word}\n")
+            await asyncio.to_thread(self._append_word_to_file, banned_words_file, word)
 
             await self.load_banned_words()
             await ctx.send(f"Added `{word}` to the banned words list.")
@@ -502,27 +732,57 @@ class Censorship(commands.Cog):
                 await ctx.send("Banned words file does not exist.")
                 return
 
-            from aiofile import async_open
-            async with async_open(banned_words_file, 'r+', encoding='utf-8') as f:
-                content = await f.read()
-                words = [line.strip() for line in content.splitlines() if line.strip() and not line.startswith('#')]
+            # The in-memory set is authoritative; only touch the file if the word is banned
+            key = word.lower()
+            if key not in self.banned_words:
+                await ctx.send(f"The word `{word}` is not in the banned words list.")
+                return
 
-                if word.lower() not in [w.lower() for w in words]:
-                    await ctx.send(f"The word `{word}` is not in the banned words list.")
-                    return
+            await asyncio.to_thread(self._remove_word_from_file, banned_words_file, key)
 
-                words = [w for w in words if w.lower() != word.lower()]
-                await f.seek(0)
-                await f.write('\n'.join(words) + '\n')
-                await f.truncate()
+            # Update the in-memory structures rather than reloading both files
+            self.banned_words.discard(key)
+            self._rebuild_banned_matchers()
 
-            await self.load_banned_words()
             await ctx.send(f"Removed `{word}` from the banned words list.")
             self.logger.info(f"Removed '{word}' from banned words by {ctx.author}.")
         except Exception as e:
             self.logger.error(f"Error removing banned word '{word}': {e}", exc_info=True)
             await ctx.send("An error occurred while removing the banned word.")
 
+    @staticmethod
+    def _append_word_to_file(file_path: str, word: str):
+        """Append a word to a word list file. Runs in a worker thread."""
+        with open(file_path, 'a', encoding='utf-8') as f:
+            f.write(f"{word}\n")
+
+    @staticmethod
+    def _remove_word_from_file(file_path: str, word: str):
+        """
+        Atomically rewrite a word list file without the given word.
+
+        Comments and other entries are preserved. Runs in a worker thread.
+
+        Args:
+            file_path (str): The path to the word list file.
+            word (str): The lowercase word to remove.
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        kept = [line for line in lines if line.strip().lower() != word or line.lstrip().startswith('#')]
+
+        # Write to a temporary file in the same directory, then swap it into place
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix='.banned_words.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.writelines(kept)
+            # mkstemp creates the file as 0600; keep the word list's original permissions
+            shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
 async def setup(bot):
     """Asynchronous setup for the Censorship cog."""
     await bot.add_cog(Censorship(bot))
\ No newline at end of file
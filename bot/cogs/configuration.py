@@ -9,6 +9,11 @@ import logging
 from utils.custom_exceptions import ConfigurationError
 from utils.config_manager import ConfigManager
 
+try:
+    from yaml import CSafeDumper as _YamlDumper  # libyaml-backed dumper, if available
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 class Configuration(commands.Cog):
     """
     Cog for managing bot configuration via commands.
@@ -62,6 +67,9 @@ class Configuration(commands.Cog):
         try:
             self.config.discord.set('admin_channel_id', str(channel.id))
             await self.config.save()
+            censorship = self.bot.get_cog('Censorship')
+            if censorship is not None:
+                censorship.set_admin_channel(channel)
             await ctx.send(f"Admin channel set to {channel.mention}.")
             self.logger.info(f"Admin channel set to {channel.name} (ID: {channel.id}) by {ctx.author}.")
         except Exception as e:
@@ -79,7 +87,7 @@ class Configuration(commands.Cog):
         """
         try:
             safe_config = self.config.get_safe_config()
-            config_text = yaml.dump(safe_config, default_flow_style=False)
+            config_text = yaml.dump(safe_config, Dumper=_YamlDumper, default_flow_style=False)
             if len(config_text) > 2000:
                 # Discord has a 2000 character limit for messages
                 await ctx.send("Configuration is too long to display.")
@@ -101,9 +109,12 @@ class Configuration(commands.Cog):
         try:
             self.config = ConfigManager('bot_config.yaml')
             self.bot.config = self.config  # Update the bot's config reference
-            await self.config.save()
-            await ctx.send("Configuration reloaded successfully.")
-            self.logger.info(f"Configuration reloaded by {ctx.author}.")
+            # Skip the re-read when the file hasn't changed since it was last loaded or saved
+            if self.config.reload():
+                await ctx.send("Configuration reloaded successfully.")
+                self.logger.info(f"Configuration reloaded by {ctx.author}.")
+            else:
+                await ctx.send("Configuration is already up to date.")
         except Exception as e:
             self.logger.error(f"Error reloading configuration: {e}", exc_info=True)
             await ctx.send("An error occurred while reloading the configuration.")
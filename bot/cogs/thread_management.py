@@ -1,12 +1,55 @@
 # cogs/thread_management.py
 
 import asyncio
+import functools
+import re
+import time
 import aiohttp
 from discord.ext import commands, tasks
 from utils.custom_exceptions import ThreadManagementError
 from utils.metrics import MetricsCollector
 from utils.config_manager import ConfigSection
 import logging
+import json
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson  # Faster JSON parsing for catalogs, if available
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Child of the application logger, so records reach its file, console and GUI handlers
+logger = logging.getLogger('bot_logger.thread_management')
+
+# HTML tags in catalog comments, which keywords should not match against
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_keywords(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile keywords into one lowercase alternation, or None if there are none."""
+    keywords = [re.escape(keyword.lower()) for keyword in keywords if keyword]
+    if not keywords:
+        return None
+    return re.compile('|'.join(keywords))
+
+# Catalog bodies larger than this (in bytes) are decoded in a worker thread
+OFFLOAD_JSON_BYTES = 64 * 1024
+
+# Catalogs with more threads than this are keyword-scanned in a worker thread
+OFFLOAD_THREAD_COUNT = 500
+
+# Maximum number of thread lines combined into one Discord message
+POST_BATCH_SIZE = 10
+
+# Bounds for the adaptive thread check interval, in seconds
+MIN_CHECK_INTERVAL = 60
+MAX_CHECK_INTERVAL = 900
+
+# Catalog fetches started within this window are shared instead of repeated
+CATALOG_TTL_SECONDS = 60
 
 class ThreadManagementCog(commands.Cog):
     """
@@ -23,26 +66,60 @@ class ThreadManagementCog(commands.Cog):
         self.bot = bot
         self.config = bot.config
 
-        # Set up logger
-        self.logger = logging.getLogger('thread_management')
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(
-                logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            )
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
-
-        # Initialize HTTP session
-        self.session = aiohttp.ClientSession()
+        self.logger = logger
+
+        # Initialize HTTP session with a pooled keep-alive connector so sockets are reused across ticks
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=4,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10),
+            headers={'User-Agent': 'ZigBot/1.0', 'Accept-Encoding': 'gzip'},
+        )
+
+        # Bound concurrent catalog fetches and Discord posts to stay under rate limits
+        thread_config = self.config.section('thread_management')
+        self._fetch_sem = asyncio.Semaphore(thread_config.get('fetch_concurrency', 8))
+        self._post_sem = asyncio.Semaphore(thread_config.get('post_concurrency', 16))
+
+        # Per-board (ETag, Last-Modified, catalog) from the last successful fetch, for conditional GETs
+        self._catalog_cache: Dict[str, Tuple[Optional[str], Optional[str], list]] = {}
+
+        # Per-board polling level: each unchanged fetch doubles that board's interval, each change halves it
+        self._board_levels: Dict[str, int] = {}
+        self._base_interval = thread_config.get('check_interval', 5) * 60
+
+        # Per-board (start time, fetch task), so channels on the same board share one request
+        self._catalog_tasks: Dict[str, Tuple[float, asyncio.Task]] = {}
+
+        # Resolved channels dict, keyed by the config object it was built from
+        self._channels_source = None
+        self._channels_cache: Dict[str, dict] = {}
+        self._following_sets: Dict[str, frozenset] = {}
+
+        # Per-board thread URL prefix, so each URL is a single concatenation
+        self._url_prefix_by_board: Dict[str, str] = {}
+
+        # Per-channel announcement state, so unchanged threads aren't posted again every tick:
+        # the (catalog, pattern, following) last processed, the matching thread numbers already
+        # announced, and each followed thread's last_modified as last seen
+        self._processed: Dict[str, tuple] = {}
+        self._announced_threads: Dict[str, set] = {}
+        self._followed_modified: Dict[str, Dict[int, Optional[int]]] = {}
 
         # Start background tasks
         self.check_threads.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         """Clean up resources when the cog is unloaded."""
         self.check_threads.cancel()
-        asyncio.create_task(self.close_session())
+        # discord.py awaits an async cog_unload, so the session is closed before unload returns
+        await self.close_session()
 
     async def close_session(self):
         """Close the aiohttp session gracefully."""
@@ -56,6 +133,8 @@ class ThreadManagementCog(commands.Cog):
         Fetch the catalog for a specific board.
 
         This method is decorated to record API latency for monitoring purposes.
+        Requests are conditional on the last response's validators, so an unchanged
+        catalog is answered with a 304 and served from the cache.
 
         Args:
             board (str): The board to fetch the catalog for.
@@ -67,18 +146,89 @@ class ThreadManagementCog(commands.Cog):
             ThreadManagementError: If the catalog fetch fails.
         """
         url = f'https://a.4cdn.org/{board}/catalog.json'
+        etag, last_modified, cached = self._catalog_cache.get(board, (None, None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
         try:
-            async with self.session.get(url, timeout=10) as response:
-                if response.status != 200:
-                    self.logger.error(f"Failed to fetch catalog for board {board}: HTTP {response.status}")
-                    raise ThreadManagementError(f"Failed to fetch catalog for board {board}: HTTP {response.status}")
-                return await response.json()
+            async with self._fetch_sem, self.session.get(url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    self._board_levels[board] = min(self._board_levels.get(board, 0) + 1, 4)
+                    return cached
+                response.raise_for_status()
+                body = await response.read()
+                if len(body) > OFFLOAD_JSON_BYTES:
+                    # Keep large decodes off the event loop
+                    data = await asyncio.to_thread(_json_loads, body)
+                else:
+                    data = _json_loads(body)
+                self._catalog_cache[board] = (
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    data,
+                )
+                self._board_levels[board] = max(self._board_levels.get(board, 0) - 1, -2)
+                return data
         except asyncio.TimeoutError:
-            self.logger.error(f"Timeout while fetching catalog for board {board}")
+            self.logger.error("Timeout while fetching catalog for board %s", board)
             raise ThreadManagementError(f"Timeout while fetching catalog for board {board}")
-        except Exception as e:
-            self.logger.error(f"Error fetching catalog for board {board}: {e}")
-            raise ThreadManagementError(f"Error fetching catalog for board {board}: {e}")
+        except aiohttp.ClientResponseError as e:
+            self.logger.error("Failed to fetch catalog for board %s: HTTP %s", board, e.status)
+            raise ThreadManagementError(f"Failed to fetch catalog for board {board}: HTTP {e.status}") from e
+        except aiohttp.ClientError as e:
+            self.logger.error("Error fetching catalog for board %s: %s", board, e)
+            raise ThreadManagementError(f"Error fetching catalog for board {board}: {e}") from e
+        except ValueError as e:
+            self.logger.error("Invalid catalog JSON for board %s: %s", board, e)
+            raise ThreadManagementError(f"Invalid catalog JSON for board {board}: {e}") from e
+
+    async def get_catalog(self, board: str) -> list:
+        """
+        Get the catalog for a board, sharing one fetch between concurrent callers.
+
+        A fetch started less than CATALOG_TTL_SECONDS ago is reused, whether it is
+        still in flight or already finished. Failed fetches are not reused.
+
+        Args:
+            board (str): The board to get the catalog for.
+
+        Returns:
+            list: The catalog data.
+        """
+        now = time.monotonic()
+        entry = self._catalog_tasks.get(board)
+        if entry is not None:
+            started, task = entry
+            failed = task.done() and (task.cancelled() or task.exception() is not None)
+            if now - started < CATALOG_TTL_SECONDS and not failed:
+                return await task
+        task = asyncio.create_task(self.fetch_catalog(board))
+        self._catalog_tasks[board] = (now, task)
+        return await task
+
+    def _get_channels(self) -> Dict[str, dict]:
+        """
+        Return the configured channels as a plain dict.
+
+        The result is cached until the config is reloaded, which replaces the section object.
+        """
+        channels_config = self.config.section('thread_management').get('channels', {})
+        if channels_config is not self._channels_source:
+            if isinstance(channels_config, ConfigSection):
+                channels = channels_config.to_dict()
+            elif isinstance(channels_config, dict):
+                channels = channels_config
+            else:
+                channels = {}
+            self._channels_source = channels_config
+            self._channels_cache = channels
+            self._following_sets = {
+                channel_id: frozenset(channel_data.get('following') or ())
+                for channel_id, channel_data in channels.items()
+            }
+        return self._channels_cache
 
     async def process_channels(self):
         """
@@ -89,14 +239,7 @@ class ThreadManagementCog(commands.Cog):
         Returns:
             list: Results from processing each channel.
         """
-        channels_config = getattr(self.config, 'thread_management', {}).get('channels', {})
-        if isinstance(channels_config, ConfigSection):
-            channels = channels_config.to_dict()
-        elif isinstance(channels_config, dict):
-            channels = channels_config
-        else:
-            channels = {}
-
+        channels = self._get_channels()
         tasks_list = [
             self.process_channel(channel_id, channel_data)
             for channel_id, channel_data in channels.items()
@@ -120,27 +263,75 @@ class ThreadManagementCog(commands.Cog):
             ThreadManagementError: If processing fails.
         """
         try:
-            board = channel_data['board']
             keywords = channel_data.get('keywords', [])
             following = channel_data.get('following', [])
+            if not keywords and not following:
+                # Nothing to match or follow, so skip the catalog fetch entirely
+                return {'new_threads': 0, 'updated_threads': 0}
 
-            catalog = await self.fetch_catalog(board)
+            channel = self.bot.get_channel(int(channel_id))
+            if channel is None:
+                self.logger.error("Channel not found: %s", channel_id)
+                return {'new_threads': 0, 'updated_threads': 0}
 
-            new_threads = self.find_new_threads(catalog, keywords)
-            updated_threads = self.update_existing_threads(catalog, following)
+            board = channel_data['board']
+            catalog = await self.get_catalog(board)
+
+            pattern = _compile_keywords(tuple(keywords))
+            following_set = self._following_sets.get(channel_id)
+            if following_set is None:
+                following_set = frozenset(following)
+
+            # A 304 hands back the same catalog object; with unchanged settings there is nothing new to report
+            processed = self._processed.get(channel_id)
+            if processed is not None and processed[0] is catalog and processed[1:] == (pattern, following_set):
+                return {'new_threads': 0, 'updated_threads': 0}
+
+            if sum(len(page.get('threads', ())) for page in catalog) > OFFLOAD_THREAD_COUNT:
+                new_threads = await asyncio.to_thread(self.find_new_threads, catalog, pattern)
+            else:
+                new_threads = self.find_new_threads(catalog, pattern)
+            updated_threads = self.update_existing_threads(catalog, following_set)
+
+            # Announce each matching thread once; threads gone from the catalog are forgotten
+            announced = self._announced_threads.get(channel_id, ())
+            self._announced_threads[channel_id] = {thread.get('no') for thread in new_threads}
+            new_threads = [thread for thread in new_threads if thread.get('no') not in announced]
+
+            # Report followed threads only when their last_modified moved since the previous check
+            seen = self._followed_modified.get(channel_id, {})
+            self._followed_modified[channel_id] = {thread['no']: thread.get('last_modified') for thread in updated_threads}
+            updated_threads = [
+                thread for thread in updated_threads
+                if thread['no'] in seen and seen[thread['no']] != thread.get('last_modified')
+            ]
+            self._processed[channel_id] = (catalog, pattern, following_set)
 
             results = {
                 'new_threads': len(new_threads),
                 'updated_threads': len(updated_threads),
             }
 
-            # Post new threads to Discord
-            for thread in new_threads:
-                await self.post_new_thread(channel_id, board, thread)
-
-            # Update existing threads if necessary
-            for thread in updated_threads:
-                await self.update_thread(channel_id, board, thread)
+            # Build each thread URL once, even if the thread is both new and followed
+            prefix = self._url_prefix_by_board.get(board)
+            if prefix is None:
+                prefix = self._url_prefix_by_board[board] = f"https://boards.4channel.org/{board}/thread/"
+            urls = {}
+            for thread in (*new_threads, *updated_threads):
+                no = thread.get('no')
+                if no not in urls:
+                    urls[no] = prefix + str(no)
+
+            # Batch lines into as few messages as possible, then send the batches concurrently
+            lines = [f"🔔 **New thread found:** {urls[thread.get('no')]}" for thread in new_threads]
+            lines += [f"🔄 **Thread Updated:** {urls[thread.get('no')]} has a new post." for thread in updated_threads]
+            posts = [
+                self.post_lines(channel, lines[i:i + POST_BATCH_SIZE])
+                for i in range(0, len(lines), POST_BATCH_SIZE)
+            ]
+            for result in await asyncio.gather(*posts, return_exceptions=True):
+                if isinstance(result, Exception):
+                    self.logger.warning("Failed to post to channel %s: %s", channel_id, result)
 
             # Update metrics
             MetricsCollector.set_active_threads(len(following))
@@ -148,106 +339,107 @@ class ThreadManagementCog(commands.Cog):
             MetricsCollector.increment_command('process_channel')
             return results
         except Exception as e:
-            self.logger.error(f"Error processing channel {channel_id}: {e}")
+            self.logger.error("Error processing channel %s: %s", channel_id, e)
             raise ThreadManagementError(f"Error processing channel {channel_id}: {e}")
 
-    def find_new_threads(self, catalog: list, keywords: list) -> list:
+    def find_new_threads(self, catalog: list, pattern: Optional[re.Pattern]) -> list:
         """
-        Find new threads matching the specified keywords.
+        Find new threads whose comment matches the keyword pattern.
 
         Args:
             catalog (list): The catalog data.
-            keywords (list): The list of keywords to search for.
+            pattern (re.Pattern or None): Compiled lowercase keyword pattern; None matches nothing.
 
         Returns:
             list: A list of threads that match the criteria.
         """
         new_threads = []
+        if pattern is None:
+            return new_threads
+        search = pattern.search
         for page in catalog:
-            for thread in page.get('threads', []):
-                comment = thread.get('com', '').lower()
-                if any(keyword.lower() in comment for keyword in keywords):
+            for thread in page.get('threads', ()):
+                comment = thread.get('com')
+                if comment and search(_HTML_TAG_RE.sub(' ', comment).lower()):
                     new_threads.append(thread)
         return new_threads
 
-    def update_existing_threads(self, catalog: list, following: list) -> list:
+    def update_existing_threads(self, catalog: list, following: frozenset) -> list:
         """
         Update information for threads already being followed.
 
         Args:
             catalog (list): The catalog data.
-            following (list): The list of thread IDs being followed.
+            following (frozenset): The IDs of the threads being followed.
 
         Returns:
             list: A list of updated threads.
         """
         updated_threads = []
-        existing_thread_ids = set(following)
+        if not following:
+            return updated_threads
         for page in catalog:
-            for thread in page.get('threads', []):
-                if thread['no'] in existing_thread_ids:
+            for thread in page.get('threads') or ():
+                if thread['no'] in following:
                     updated_threads.append(thread)
         return updated_threads
 
-    async def post_new_thread(self, channel_id: str, board: str, thread: dict):
+    async def post_lines(self, channel, lines: list):
         """
-        Post information about a new thread to the Discord channel.
+        Post a batch of thread notifications to the Discord channel as one message.
 
         Args:
-            channel_id (str): Channel ID where to post the thread.
-            board (str): The board of the thread.
-            thread (dict): Thread data.
+            channel (discord.TextChannel): Channel where to post the notifications.
+            lines (list): Notification lines, at most POST_BATCH_SIZE of them.
         """
-        channel = self.bot.get_channel(int(channel_id))
-        if channel:
-            thread_url = f"https://boards.4channel.org/{board}/thread/{thread.get('no')}"
-            try:
-                await channel.send(f"🔔 **New thread found:** {thread_url}")
-                self.logger.info(f"Posted new thread to channel {channel_id}: {thread_url}")
-            except Exception as e:
-                self.logger.error(f"Failed to post new thread to channel {channel_id}: {e}", exc_info=True)
-        else:
-            self.logger.error(f"Channel not found: {channel_id}")
+        try:
+            async with self._post_sem:
+                await channel.send('\n'.join(lines))
+            self.logger.info("Posted %d thread notification(s) to channel %s.", len(lines), channel.id)
+        except Exception as e:
+            self.logger.error("Failed to post thread notifications to channel %s: %s", channel.id, e, exc_info=e)
 
-    async def update_thread(self, channel_id: str, board: str, thread: dict):
+    def next_check_interval(self) -> float:
         """
-        Update information about an existing thread in the Discord channel.
+        Compute the delay before the next thread check.
 
-        Args:
-            channel_id (str): Channel ID where to update the thread.
-            board (str): The board of the thread.
-            thread (dict): Thread data.
+        Each board's interval is the base `check_interval` scaled by its polling level and
+        clamped to [MIN_CHECK_INTERVAL, MAX_CHECK_INTERVAL]; the busiest board sets the pace.
+        Boards whose channels have no keywords or followed threads are never fetched and are ignored.
+
+        Returns:
+            float: The next interval in seconds.
         """
-        # Placeholder for thread update logic.
-        # Implement any specific updates you want to perform on existing threads.
-        channel = self.bot.get_channel(int(channel_id))
-        if channel:
-            thread_url = f"https://boards.4channel.org/{board}/thread/{thread.get('no')}"
-            try:
-                await channel.send(f"🔄 **Thread Updated:** {thread_url} has a new post.")
-                self.logger.info(f"Updated thread in channel {channel_id}: {thread_url}")
-            except Exception as e:
-                self.logger.error(f"Failed to post thread update to channel {channel_id}: {e}", exc_info=True)
-        else:
-            self.logger.error(f"Channel not found: {channel_id}")
+        boards = {
+            channel_data.get('board')
+            for channel_data in self._get_channels().values()
+            if channel_data.get('keywords') or channel_data.get('following')
+        }
+        intervals = [
+            min(MAX_CHECK_INTERVAL, max(MIN_CHECK_INTERVAL, self._base_interval * 2 ** self._board_levels.get(board, 0)))
+            for board in boards
+        ]
+        return min(intervals, default=self._base_interval)
 
     @tasks.loop(minutes=5.0)
     async def check_threads(self):
         """
         Background task to periodically check and update threads.
 
-        This task runs every 5 minutes by default.
+        The interval adapts per tick: boards whose catalog is unchanged (HTTP 304) back off
+        up to MAX_CHECK_INTERVAL, and boards that keep changing are polled down to MIN_CHECK_INTERVAL.
         """
         self.logger.info("Starting periodic thread check")
         try:
             results = await self.process_channels()
             # Filter out exceptions from results
             clean_results = [res for res in results if not isinstance(res, Exception)]
-            self.logger.info(f"Thread check completed. Results: {clean_results}")
+            self.logger.info("Thread check completed. Results: %s", clean_results)
         except ThreadManagementError as e:
-            self.logger.error(f"ThreadManagementError during thread check: {e}", exc_info=True)
+            self.logger.error("ThreadManagementError during thread check: %s", e, exc_info=e)
         except Exception as e:
-            self.logger.error(f"Unexpected error during thread check: {e}", exc_info=True)
+            self.logger.error("Unexpected error during thread check: %s", e, exc_info=e)
+        self.check_threads.change_interval(seconds=self.next_check_interval())
 
     @check_threads.before_loop
     async def before_check_threads(self):
@@ -270,7 +462,7 @@ class ThreadManagementCog(commands.Cog):
             await ctx.send("Invalid argument provided.")
         else:
             await ctx.send(f"An unexpected error occurred: {error}")
-            self.logger.error(f"Error in thread management command: {error}", exc_info=error)
+            self.logger.error("Error in thread management command: %s", error, exc_info=error)
 
 async def setup(bot):
     """
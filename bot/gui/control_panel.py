@@ -1,18 +1,19 @@
 import sys
 import os
+import atexit
 import asyncio
 import threading
-import time
 import logging
-import psutil  # Added for extended resource monitoring
+import time
+from collections import deque
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QPushButton, QVBoxLayout, QHBoxLayout,
     QWidget, QTextEdit, QLineEdit, QLabel, QFileDialog, QInputDialog, QGroupBox,
     QScrollArea, QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
-from PyQt5.QtGui import QPixmap, QPainter, QTextCharFormat, QColor
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer, QPointF
+from PyQt5.QtGui import QPixmap, QPainter, QTextCharFormat, QColor, QTextCursor
 
 try:
     from PyQt5.QtChart import QChart, QChartView, QLineSeries, QValueAxis
@@ -29,33 +30,55 @@ if bot_dir not in sys.path:
 from main import DiscordBot
 from utils.config_manager import ConfigManager
 
-class BotThread(threading.Thread):
-    class LogSignal(QObject):
-        signal = pyqtSignal(str, str)  # Added log level
+CHART_SAMPLES = 50  # Points kept per chart series
+CHART_WINDOW_SECONDS = CHART_SAMPLES * 5  # Metrics are sampled every 5 seconds
+BYTES_PER_MB = 1024 * 1024
+ERROR_POPUP_INTERVAL = 5  # Minimum seconds between error pop-ups
+
+def _make_log_format(color):
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    return fmt
+
+class QueueLogHandler(logging.Handler):
+    """Logging handler that hands formatted records to the control panel's log queue."""
 
+    def __init__(self, log, level=logging.INFO):
+        super().__init__(level)
+        self.log = log
+
+    def emit(self, record):
+        try:
+            self.log(self.format(record), record.levelname)
+        except Exception:
+            self.handleError(record)
+
+class BotThread(threading.Thread):
     class StatusSignal(QObject):
         signal = pyqtSignal(str)
 
-    class MetricsSignal(QObject):
-        signal = pyqtSignal(float, float, float, float, float, dict)  # Added new metrics
-
-    def __init__(self):
+    def __init__(self, config=None):
         super().__init__()
-        self.config = ConfigManager('bot_config.yaml')
+        self.config = config or ConfigManager('bot_config.yaml')
         self.token = self.config.discord.token
         self.prefix = self.config.discord.get('prefix', '!')
         self.admin_channel_id = self.config.bot.get('admin_channel_id', None)
         self.loop = None
         self.bot = None
-        self.log_signal = self.LogSignal()
+        # Log entries queued from any thread and drained in batches by the GUI.
+        # A plain threading.Lock is enough: producers span the bot and GUI threads and
+        # nothing awaits while holding it, so an asyncio.Lock would only add overhead.
+        self.log_queue = deque(maxlen=10_000)
+        self._log_lock = threading.Lock()
         self.status_signal = self.StatusSignal()
-        self.metrics_signal = self.MetricsSignal()
-        self._stop_event = threading.Event()
         self.daemon = True  # Ensure the thread exits when the main program does
 
     def run(self):
         try:
             self.loop = asyncio.new_event_loop()
+            if sys.version_info >= (3, 12):
+                # Coroutines that finish without suspending run inline instead of via the loop queue
+                self.loop.set_task_factory(asyncio.eager_task_factory)
             asyncio.set_event_loop(self.loop)
             self.bot = DiscordBot(status_callback=self.on_status_update)
             self.bot.bot.command_prefix = self.prefix
@@ -63,8 +86,8 @@ class BotThread(threading.Thread):
             self.bot.config.bot.set('admin_channel_id', self.admin_channel_id)
             # Update config with token
             self.bot.config.discord.set('token', self.token)
-            # Connect bot's logger to the control panel's log signal
-            self.bot.bot.logger = self.BotLogger(self.log_signal.signal)
+            # Connect bot's logger to the control panel's log queue
+            self.bot.bot.logger = self.BotLogger(self.log)
 
             # Adjust logging levels to prevent Unicode errors
             logging.getLogger('discord').setLevel(logging.INFO)
@@ -72,7 +95,7 @@ class BotThread(threading.Thread):
             logging.getLogger('asyncio').setLevel(logging.WARNING)
 
             self.status_signal.signal.emit("Starting")
-            self.log_signal.signal.emit("Starting bot...", "INFO")
+            self.log("Starting bot...", "INFO")
 
             # Debug: Check if the token has been loaded correctly
             if self.token and len(self.token) >= 59:
@@ -82,7 +105,7 @@ class BotThread(threading.Thread):
 
             self.loop.run_until_complete(self.start_bot())
         except Exception as e:
-            self.log_signal.signal.emit(f"Bot encountered an error: {e}", "ERROR")
+            self.log(f"Bot encountered an error: {e}", "ERROR")
             self.status_signal.signal.emit("Error")
             import traceback
             traceback.print_exc()
@@ -91,7 +114,7 @@ class BotThread(threading.Thread):
                 self.loop.run_until_complete(self.bot.stop())
             self.loop.close()
             self.status_signal.signal.emit("Offline")
-            self.log_signal.signal.emit("Bot has been stopped.", "INFO")
+            self.log("Bot has been stopped.", "INFO")
 
     async def start_bot(self):
         await self.bot.start(self.token)
@@ -99,61 +122,68 @@ class BotThread(threading.Thread):
     def stop(self):
         if self.bot and not self.bot.bot.is_closed():
             self.status_signal.signal.emit("Stopping")
-            self.log_signal.signal.emit("Stopping bot...", "WARNING")
+            self.log("Stopping bot...", "WARNING")
             asyncio.run_coroutine_threadsafe(self.bot.stop(), self.loop)
-            self._stop_event.set()
 
     def on_status_update(self, status):
         self.status_signal.signal.emit(status)
 
-    def collect_metrics(self):
-        """
-        Collect metrics and emit them via the metrics_signal.
-        """
-        while not self._stop_event.is_set():
-            if self.bot:
-                uptime = self.bot.get_uptime()
-                memory = self.bot.get_memory_usage()
-                cpu = self.bot.get_cpu_usage()
-
-                # Extended metrics
-                disk_io = self.bot.get_disk_io_usage()
-                network = self.bot.get_network_usage()
-                thread_performance = self.bot.get_thread_performance()
+    def log(self, message, level="INFO"):
+        """Queue a log entry for the control panel. Safe to call from any thread."""
+        with self._log_lock:
+            self.log_queue.append((message, level))
 
-                self.metrics_signal.signal.emit(uptime, memory, cpu, disk_io, network, thread_performance)
-            time.sleep(5)  # Collect metrics every 5 seconds
+    def drain_logs(self):
+        """Remove and return all queued (message, level) log entries."""
+        with self._log_lock:
+            entries = list(self.log_queue)
+            self.log_queue.clear()
+        return entries
 
     class BotLogger:
-        def __init__(self, log_signal):
-            self.log_signal = log_signal
+        def __init__(self, log):
             self.logger = logging.getLogger('bot_logger')
-            # Ensure the logger has handlers
-            if not self.logger.handlers:
+            # Ensure the logger has a file handler
+            if not any(isinstance(h, logging.FileHandler) for h in self.logger.handlers):
                 handler = logging.FileHandler('bot_control_panel.log', encoding='utf-8')
                 handler.setFormatter(
                     logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
                 )
                 self.logger.addHandler(handler)
                 self.logger.setLevel(logging.DEBUG)
+            # Route records to this thread's log queue, replacing the handler of a previous run
+            for handler in self.logger.handlers[:]:
+                if isinstance(handler, QueueLogHandler):
+                    self.logger.removeHandler(handler)
+            self.logger.addHandler(QueueLogHandler(log))
 
         def info(self, message, *args, **kwargs):
-            self.log_signal.emit(message, "INFO")
             self.logger.info(message, *args, **kwargs)
 
         def warning(self, message, *args, **kwargs):
-            self.log_signal.emit(message, "WARNING")
             self.logger.warning(message, *args, **kwargs)
 
         def error(self, message, *args, **kwargs):
-            self.log_signal.emit(message, "ERROR")
             self.logger.error(message, *args, **kwargs)
 
         def critical(self, message, *args, **kwargs):
-            self.log_signal.emit(message, "CRITICAL")
             self.logger.critical(message, *args, **kwargs)
 
 class ControlPanel(QMainWindow):
+    # (action, plugin name, error message or ''); emitted from the bot loop, delivered on the GUI thread
+    plugin_done = pyqtSignal(str, str, str)
+
+    # Text formats for each log level, built once and reused for every entry
+    _LEVEL_FMTS = {
+        level: _make_log_format(color)
+        for level, color in (
+            ("INFO", "#FFFFFF"),  # White
+            ("WARNING", "#FFA500"),  # Orange
+            ("ERROR", "#FF0000"),  # Red
+            ("CRITICAL", "#FF69B4"),  # Pink
+        )
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Discord Bot Control Panel")
@@ -164,6 +194,11 @@ class ControlPanel(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.main_layout = QHBoxLayout(self.central_widget)
 
+        self.plugin_done.connect(self._on_plugin_done)
+
+        # Shared configuration; only re-read from disk on an explicit reload
+        self._config = ConfigManager('bot_config.yaml')
+
         # Initialize attributes
         self.bot_thread = None
         self.token_input = None
@@ -181,9 +216,40 @@ class ControlPanel(QMainWindow):
         self.disk_io_series = None  # New series for disk I/O
         self.network_series = None  # New series for network usage
         self.data_counter = 0
+        # Last 50 chart samples as (x, cpu, memory, disk_io, network)
+        self._chart_history = deque(maxlen=CHART_SAMPLES)
         self.active_cogs_plugins = None
+        # Sorted (cogs, plugins) last written to the panel, to skip redundant redraws
+        self._last_cogs_plugins_key = None
         self.plugin_list = None
 
+        # Poll bot metrics from the GUI event loop while the bot is running
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(5000)
+        self.metrics_timer.timeout.connect(self._poll_metrics)
+
+        # Persistent log, kept open and buffered; flushed periodically and on errors
+        self._log_fh = open('control_panel.log', 'a', buffering=65536, encoding='utf-8')
+        atexit.register(self._log_fh.close)
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setInterval(30000)
+        self.log_flush_timer.timeout.connect(self._log_fh.flush)
+        self.log_flush_timer.start()
+
+        # Render queued bot log entries in batches instead of one GUI update per entry
+        self.log_drain_timer = QTimer(self)
+        self.log_drain_timer.setInterval(100)
+        self.log_drain_timer.timeout.connect(self._drain_logs)
+        self.log_drain_timer.start()
+
+        # Error pop-ups are rate limited; errors arriving in between are summarized once
+        self._last_popup_ts = 0.0
+        self._suppressed_errors = 0
+        self.error_summary_timer = QTimer(self)
+        self.error_summary_timer.setSingleShot(True)
+        self.error_summary_timer.setInterval(ERROR_POPUP_INTERVAL * 1000)
+        self.error_summary_timer.timeout.connect(self._show_suppressed_errors)
+
         # Initialize UI components before loading config
         self.create_sidebar()
         self.create_main_area()
@@ -313,30 +379,39 @@ class ControlPanel(QMainWindow):
             self.chart.setTitle("Resource Usage Over Time")
             self.cpu_series = QLineSeries(name="CPU Usage (%)")
             self.memory_series = QLineSeries(name="Memory Usage (MB)")
-            self.disk_io_series = QLineSeries(name="Disk I/O (Bytes)")
-            self.network_series = QLineSeries(name="Network Usage (Bytes)")
+            self.disk_io_series = QLineSeries(name="Disk I/O (MB/s)")
+            self.network_series = QLineSeries(name="Network Usage (MB/s)")
             self.chart.addSeries(self.cpu_series)
             self.chart.addSeries(self.memory_series)
             self.chart.addSeries(self.disk_io_series)
             self.chart.addSeries(self.network_series)
 
-            axis_x = QValueAxis()
-            axis_x.setLabelFormat("%d")
-            axis_x.setTitleText("Time (s)")
-            self.chart.addAxis(axis_x, Qt.AlignBottom)
-            self.cpu_series.attachAxis(axis_x)
-            self.memory_series.attachAxis(axis_x)
-            self.disk_io_series.attachAxis(axis_x)
-            self.network_series.attachAxis(axis_x)
-
-            axis_y = QValueAxis()
-            axis_y.setLabelFormat("%.1f")
-            axis_y.setTitleText("Usage")
-            self.chart.addAxis(axis_y, Qt.AlignLeft)
-            self.cpu_series.attachAxis(axis_y)
-            self.memory_series.attachAxis(axis_y)
-            self.disk_io_series.attachAxis(axis_y)
-            self.network_series.attachAxis(axis_y)
+            # Fixed axis ranges so Qt doesn't re-scan every point for bounds on each tick
+            self.axis_x = QValueAxis()
+            self.axis_x.setLabelFormat("%d")
+            self.axis_x.setTitleText("Time (s)")
+            self.axis_x.setRange(0, CHART_WINDOW_SECONDS)
+            self.chart.addAxis(self.axis_x, Qt.AlignBottom)
+
+            axis_percent = QValueAxis()
+            axis_percent.setLabelFormat("%d")
+            axis_percent.setTitleText("CPU (%)")
+            axis_percent.setRange(0, 100)
+            self.chart.addAxis(axis_percent, Qt.AlignLeft)
+
+            # Memory, disk and network share a megabyte axis that only ever grows
+            self.axis_mb = QValueAxis()
+            self.axis_mb.setLabelFormat("%.1f")
+            self.axis_mb.setTitleText("MB / MB/s")
+            self._axis_mb_max = 100.0
+            self.axis_mb.setRange(0, self._axis_mb_max)
+            self.chart.addAxis(self.axis_mb, Qt.AlignRight)
+
+            for series in (self.cpu_series, self.memory_series, self.disk_io_series, self.network_series):
+                series.attachAxis(self.axis_x)
+            self.cpu_series.attachAxis(axis_percent)
+            for series in (self.memory_series, self.disk_io_series, self.network_series):
+                series.attachAxis(self.axis_mb)
 
             chart_view = QChartView(self.chart)
             chart_view.setRenderHint(QPainter.Antialiasing)
@@ -362,6 +437,8 @@ class ControlPanel(QMainWindow):
 
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
+        # Keep only the most recent entries so memory and relayout cost stay bounded
+        self.log_display.document().setMaximumBlockCount(5000)
         layout.addWidget(self.log_display)
 
         clear_logs_button = QPushButton("Clear Logs")
@@ -402,6 +479,10 @@ class ControlPanel(QMainWindow):
         save_button.clicked.connect(self.save_config)
         layout.addWidget(save_button)
 
+        reload_button = QPushButton("Reload Configuration")
+        reload_button.clicked.connect(self.reload_config)
+        layout.addWidget(reload_button)
+
         layout.addStretch()
         config_tab.setWidget(config_widget)
         return config_tab
@@ -430,57 +511,100 @@ class ControlPanel(QMainWindow):
 
     def start_bot(self):
         if self.bot_thread is None or not self.bot_thread.is_alive():
-            config_manager = ConfigManager('bot_config.yaml')
-            token = config_manager.discord.token
-            prefix = config_manager.discord.get('prefix', '!')
-            admin_channel_id = config_manager.bot.get('admin_channel_id', None)
+            token = self._config.discord.token
             if not token or token.strip() == "" or token.strip() == "${DISCORD_TOKEN}":
                 self.update_log("Error: No Discord token provided or token is improperly set. Please enter it in the Configuration tab.", "ERROR")
                 return
-            self.bot_thread = BotThread()
+            self.bot_thread = BotThread(config=self._config)
             # Connect signals to slots
-            self.bot_thread.log_signal.signal.connect(self.update_log)
             self.bot_thread.status_signal.signal.connect(self.update_status)
-            self.bot_thread.metrics_signal.signal.connect(self.update_metrics)
             # Start the bot thread
             self.bot_thread.start()
-            # Start metrics collection in a separate thread
-            threading.Thread(target=self.bot_thread.collect_metrics, daemon=True).start()
+            self.metrics_timer.start()
         else:
             QMessageBox.warning(self, "Bot Already Running", "The bot is already running.")
 
     def stop_bot(self):
         if self.bot_thread and self.bot_thread.is_alive():
+            self.metrics_timer.stop()
             self.bot_thread.stop()
             self.bot_thread.join()
+            self._drain_logs()
             self.bot_thread = None
             self.update_status("Offline")
         else:
             QMessageBox.warning(self, "Bot Not Running", "The bot is not currently running.")
 
+    def _poll_metrics(self):
+        # snapshot_metrics is non-blocking, so it is read directly on the GUI thread
+        if self.bot_thread and self.bot_thread.is_alive() and self.bot_thread.bot:
+            self.update_metrics(*self.bot_thread.bot.snapshot_metrics())
+
     def restart_bot(self):
         self.stop_bot()
         self.start_bot()
 
     def update_log(self, message, level="INFO"):
-        color = {
-            "INFO": "#FFFFFF",  # White
-            "WARNING": "#FFA500",  # Orange
-            "ERROR": "#FF0000",  # Red
-            "CRITICAL": "#FF69B4",  # Pink
-        }.get(level, "#FFFFFF")
-
-        log_entry = f"[{level}] {message}"
-        self.log_display.setTextColor(QColor(color))
-        self.log_display.append(log_entry)
-
-        # Pop-up for critical events
-        if level in ("ERROR", "CRITICAL"):
-            QMessageBox.critical(self, "Critical Event", message)
-
-        # Persistent log
-        with open('control_panel.log', 'a', encoding='utf-8') as f:
-            f.write(f"{log_entry}\n")
+        self.append_log_entries([(message, level)])
+
+    def _drain_logs(self):
+        if self.bot_thread:
+            entries = self.bot_thread.drain_logs()
+            if entries:
+                self.append_log_entries(entries)
+
+    def append_log_entries(self, entries):
+        """Render a batch of (message, level) log entries with a single display update."""
+        formats = self._LEVEL_FMTS
+        default_fmt = formats["INFO"]
+
+        scrollbar = self.log_display.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        document = self.log_display.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+
+        # One edit block per batch, so the document is laid out and repainted once
+        errors = []
+        cursor.beginEditBlock()
+        for message, level in entries:
+            log_entry = f"[{level}] {message}"
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(log_entry, formats.get(level, default_fmt))
+            # Persistent log
+            self._log_fh.write(f"{log_entry}\n")
+            if level in ("ERROR", "CRITICAL"):
+                errors.append(message)
+        cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+        if errors:
+            # Flush right away so errors survive a crash
+            self._log_fh.flush()
+            self._show_error_popup(errors)
+
+    def _show_error_popup(self, errors):
+        """Pop up the first error unless one was shown recently; count the rest for a summary."""
+        now = time.monotonic()
+        if now - self._last_popup_ts >= ERROR_POPUP_INTERVAL:
+            self._last_popup_ts = now
+            self._suppressed_errors += len(errors) - 1
+            QMessageBox.critical(self, "Critical Event", errors[0])
+        else:
+            self._suppressed_errors += len(errors)
+        if self._suppressed_errors and not self.error_summary_timer.isActive():
+            self.error_summary_timer.start()
+
+    def _show_suppressed_errors(self):
+        count, self._suppressed_errors = self._suppressed_errors, 0
+        if count:
+            self._last_popup_ts = time.monotonic()
+            QMessageBox.critical(
+                self, "Critical Events",
+                f"{count} more error(s) in the last {ERROR_POPUP_INTERVAL} seconds. See the log for details."
+            )
 
     def update_status(self, status):
         self.status_label.setText(f"Status: {status}")
@@ -489,9 +613,11 @@ class ControlPanel(QMainWindow):
             self.update_active_cogs_plugins()
             self.update_log("Bot is now online.", "INFO")
         elif status == "Offline":
+            self.metrics_timer.stop()
             self.status_label.setStyleSheet("font-weight: bold; color: #FF6B6B;")
             self.update_log("Bot is now offline.", "WARNING")
         elif status == "Error":
+            self.metrics_timer.stop()
             self.status_label.setStyleSheet("font-weight: bold; color: #FF6B6B;")
             self.update_log("Bot encountered an error.", "ERROR")
         else:
@@ -500,28 +626,38 @@ class ControlPanel(QMainWindow):
 
     def clear_logs(self):
         self.log_display.clear()
-        open('control_panel.log', 'w').close()  # Clear the persistent log file
+        # Clear the persistent log file, dropping anything still buffered
+        self._log_fh.seek(0)
+        self._log_fh.truncate(0)
 
     def load_config(self):
         try:
-            config_manager = ConfigManager('bot_config.yaml')
-            self.token_input.setText(config_manager.discord.token)
-            self.prefix_input.setText(config_manager.discord.get('prefix', '!'))
-            self.admin_channel_input.setText(config_manager.bot.get('admin_channel_id', ''))
+            self.token_input.setText(self._config.discord.token)
+            self.prefix_input.setText(self._config.discord.get('prefix', '!'))
+            self.admin_channel_input.setText(self._config.bot.get('admin_channel_id', ''))
         except Exception as e:
             self.update_log(f"Failed to load configuration: {e}", "ERROR")
 
     def save_config(self):
         try:
-            config_manager = ConfigManager('bot_config.yaml')
-            config_manager.discord.set('token', self.token_input.text())
-            config_manager.discord.set('prefix', self.prefix_input.text())
-            config_manager.bot.set('admin_channel_id', self.admin_channel_input.text())
-            asyncio.run(config_manager.save())
+            self._config.discord.set('token', self.token_input.text())
+            self._config.discord.set('prefix', self.prefix_input.text())
+            self._config.bot.set('admin_channel_id', self.admin_channel_input.text())
+            self._config.save_sync()
             self.update_log("Configuration saved successfully.", "INFO")
         except Exception as e:
             self.update_log(f"Error saving configuration: {e}", "ERROR")
 
+    def reload_config(self):
+        try:
+            if self._config.reload():
+                self.load_config()
+                self.update_log("Configuration reloaded from disk.", "INFO")
+            else:
+                self.update_log("Configuration file unchanged; nothing to reload.", "INFO")
+        except Exception as e:
+            self.update_log(f"Error reloading configuration: {e}", "ERROR")
+
     def refresh_plugins(self):
         if self.bot_thread and self.bot_thread.is_alive():
             plugins = self.bot_thread.bot.plugin_manager.list_plugins()
@@ -536,15 +672,9 @@ class ControlPanel(QMainWindow):
             plugin_path, _ = QFileDialog.getOpenFileName(self, "Select Plugin", "", "Python Files (*.py)")
             if plugin_path:
                 plugin_name = os.path.basename(plugin_path)[:-3]
-                try:
-                    asyncio.run_coroutine_threadsafe(
-                        self.bot_thread.bot.plugin_manager.load_plugin(plugin_name),
-                        self.bot_thread.loop
-                    ).result()
-                    self.update_log(f"Plugin loaded: {plugin_name}", "INFO")
-                    self.refresh_plugins()
-                except Exception as e:
-                    self.update_log(f"Error loading plugin: {e}", "ERROR")
+                self._run_plugin_action(
+                    'load', plugin_name, self.bot_thread.bot.plugin_manager.load_plugin(plugin_name)
+                )
         else:
             self.update_log("Bot is not running. Cannot load plugin.", "WARNING")
 
@@ -552,18 +682,27 @@ class ControlPanel(QMainWindow):
         if self.bot_thread and self.bot_thread.is_alive():
             plugin_name, ok = QInputDialog.getText(self, "Unload Plugin", "Enter plugin name:")
             if ok and plugin_name:
-                try:
-                    asyncio.run_coroutine_threadsafe(
-                        self.bot_thread.bot.plugin_manager.unload_plugin(plugin_name),
-                        self.bot_thread.loop
-                    ).result()
-                    self.update_log(f"Plugin unloaded: {plugin_name}", "INFO")
-                    self.refresh_plugins()
-                except Exception as e:
-                    self.update_log(f"Error unloading plugin: {e}", "ERROR")
+                self._run_plugin_action(
+                    'unload', plugin_name, self.bot_thread.bot.plugin_manager.unload_plugin(plugin_name)
+                )
         else:
             self.update_log("Bot is not running. Cannot unload plugin.", "WARNING")
 
+    def _run_plugin_action(self, action, plugin_name, coro):
+        """Schedule a plugin coroutine on the bot loop and report its outcome without blocking the GUI."""
+        def done(future):
+            error = '' if future.cancelled() else str(future.exception() or '')
+            self.plugin_done.emit(action, plugin_name, error)
+
+        asyncio.run_coroutine_threadsafe(coro, self.bot_thread.loop).add_done_callback(done)
+
+    def _on_plugin_done(self, action, plugin_name, error):
+        if error:
+            self.update_log(f"Error {action}ing plugin: {error}", "ERROR")
+        else:
+            self.update_log(f"Plugin {action}ed: {plugin_name}", "INFO")
+            self.refresh_plugins()
+
     def update_metrics(self, uptime, memory, cpu, disk_io, network, thread_performance):
         self.uptime_label.setText(f"Uptime: {uptime:.2f} seconds")
         self.memory_label.setText(f"Memory Usage: {memory:.2f} MB")
@@ -573,24 +712,34 @@ class ControlPanel(QMainWindow):
         self.update_log(f"Updated metrics. CPU: {cpu:.2f}%, Memory: {memory:.2f} MB", "INFO")
 
         if QChart is not None:
-            self.cpu_series.append(self.data_counter, cpu)
-            self.memory_series.append(self.data_counter, memory)
-            self.disk_io_series.append(self.data_counter, disk_io)
-            self.network_series.append(self.data_counter, network)
+            disk_mb = disk_io / BYTES_PER_MB
+            network_mb = network / BYTES_PER_MB
+            self._chart_history.append((self.data_counter, cpu, memory, disk_mb, network_mb))
             self.data_counter += 5  # Assuming update every 5 seconds
-            if self.cpu_series.count() > 50:
-                self.cpu_series.removePoints(0, self.cpu_series.count() - 50)
-                self.memory_series.removePoints(0, self.memory_series.count() - 50)
-                self.disk_io_series.removePoints(0, self.disk_io_series.count() - 50)
-                self.network_series.removePoints(0, self.network_series.count() - 50)
+            # The deque drops the oldest sample; each series is swapped in with a single replace()
+            history = self._chart_history
+            start = history[0][0]
+            self.axis_x.setRange(start, start + CHART_WINDOW_SECONDS)
+            peak = max(memory, disk_mb, network_mb)
+            if peak > self._axis_mb_max:
+                self._axis_mb_max = peak * 1.25
+                self.axis_mb.setRange(0, self._axis_mb_max)
+            for column, series in enumerate(
+                (self.cpu_series, self.memory_series, self.disk_io_series, self.network_series), 1
+            ):
+                series.replace([QPointF(sample[0], sample[column]) for sample in history])
 
     def update_active_cogs_plugins(self):
         """Update the list of active cogs and plugins."""
         if self.bot_thread and self.bot_thread.is_alive():
-            cogs = list(self.bot_thread.bot.bot.cogs.keys())
-            plugins = list(self.bot_thread.bot.plugin_manager.plugins.keys())
+            cogs = tuple(sorted(self.bot_thread.bot.bot.cogs))
+            plugins = tuple(sorted(self.bot_thread.bot.plugin_manager.plugins))
+            key = (cogs, plugins)
+            if key == self._last_cogs_plugins_key:
+                return
+            self._last_cogs_plugins_key = key
             text = f"Active Cogs:\n{', '.join(cogs)}\n\nActive Plugins:\n{', '.join(plugins)}"
-            self.active_cogs_plugins.setText(text)
+            self.active_cogs_plugins.setPlainText(text)
             self.update_log("Updated active cogs and plugins.", "INFO")
 
 if __name__ == "__main__":
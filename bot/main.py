@@ -11,14 +11,17 @@ Usage:
 
 import os
 import sys
+import atexit
+import queue
 import asyncio
 import signal
 import time
-import psutil
+import functools
 import discord
 from dotenv import load_dotenv
 from discord.ext import commands
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from utils.config_manager import ConfigManager
@@ -27,6 +30,12 @@ from utils.plugin_manager import PluginManager
 from utils.backup_manager import BackupManager
 from utils.metrics import MetricsCollector
 
+try:
+    # libuv-based event loop for standalone runs, if installed (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Ensure the bot package directory is in sys.path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, '..'))
@@ -45,6 +54,30 @@ discord_token = os.getenv('DISCORD_TOKEN') or config.discord.get('token')
 if not discord_token:
     raise ConfigurationError("Discord token is required to run the bot.")
 
+# System-wide disk/network counters and per-thread times are re-read at most this often (seconds)
+EXPENSIVE_METRICS_INTERVAL = 30
+# Buffered per-message metric increments are pushed to Prometheus this often (seconds)
+METRICS_FLUSH_INTERVAL = 1.0
+
+async def _reply_command_not_found(ctx, error):
+    await ctx.send("Command not found.")
+
+async def _reply_missing_argument(ctx, error):
+    await ctx.send("Missing arguments for the command.")
+
+async def _reply_on_cooldown(ctx, error):
+    await ctx.send(f"Command is on cooldown. Try again after {error.retry_after:.2f} seconds.")
+
+async def _reply_command_error(ctx, error):
+    await ctx.send("An error occurred while processing the command.")
+
+# Command error type -> reply coroutine; looked up along the error's MRO, so subclasses match too
+_COMMAND_ERROR_HANDLERS = {
+    commands.CommandNotFound: _reply_command_not_found,
+    commands.MissingRequiredArgument: _reply_missing_argument,
+    commands.CommandOnCooldown: _reply_on_cooldown,
+}
+
 class DiscordBot:
     """
     Main bot class that encapsulates all bot functionality.
@@ -69,7 +102,11 @@ class DiscordBot:
         self.plugin_manager = PluginManager(self.bot)
         self.backup_manager = BackupManager(self.config)
         self.metrics = MetricsCollector()
+        self.metrics.set_latency_enabled(self.config.section('metrics').get('latency_enabled', True))
         self.start_time = time.time()
+        self._metrics_cache = {}  # metric name -> (monotonic timestamp, value)
+        self._cogs_cache = None  # (cogs directory st_mtime_ns, cog module names)
+        self._metrics_flush_task = None
         self.status_callback = status_callback
         self.setup_logging()
         self.register_events()
@@ -94,12 +131,26 @@ class DiscordBot:
             logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         )
 
+        # The handlers run on a QueueListener thread, so log writes never block the event loop
+        log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(log_queue, file_handler, console_handler)
+        self._log_listener.start()
+        atexit.register(self._stop_log_listener)
+
         self.bot.logger = logging.getLogger('bot_logger')
         self.bot.logger.setLevel(log_level)
-        self.bot.logger.addHandler(file_handler)
-        self.bot.logger.addHandler(console_handler)
+        for handler in self.bot.logger.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                self.bot.logger.removeHandler(handler)  # Left over from a previous DiscordBot
+        self.bot.logger.addHandler(QueueHandler(log_queue))
         self.bot.logger.info("Logger initialized.")
 
+    def _stop_log_listener(self):
+        """Write out any queued log records and stop the logging thread."""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
     def register_events(self):
         """Register bot event handlers."""
 
@@ -111,6 +162,10 @@ class DiscordBot:
             await self.load_cogs()
             await self.plugin_manager.load_plugins()
             asyncio.create_task(self.backup_manager.run_periodic_backup())
+            if self._metrics_flush_task is None:
+                self._metrics_flush_task = asyncio.create_task(
+                    self.metrics.flush_loop(METRICS_FLUSH_INTERVAL)
+                )
             if self.status_callback:
                 self.status_callback("Online")
 
@@ -133,27 +188,41 @@ class DiscordBot:
             """Handle command errors gracefully."""
             if hasattr(ctx.command, 'on_error'):
                 return  # Skip if custom error handler is defined
-            if isinstance(error, commands.CommandNotFound):
-                await ctx.send("Command not found.")
-            elif isinstance(error, commands.MissingRequiredArgument):
-                await ctx.send("Missing arguments for the command.")
-            elif isinstance(error, commands.CommandOnCooldown):
-                await ctx.send(f"Command is on cooldown. Try again after {error.retry_after:.2f} seconds.")
+            if ctx.cog and ctx.cog.has_error_handler():
+                return  # Skip if the cog handles its own errors
+            for error_type in type(error).__mro__:
+                handler = _COMMAND_ERROR_HANDLERS.get(error_type)
+                if handler is not None:
+                    break
             else:
-                await ctx.send("An error occurred while processing the command.")
+                handler = _reply_command_error
+            await handler(ctx, error)
             self.bot.logger.error(f'Error in command {ctx.command}: {error}', exc_info=True)
 
     async def load_cogs(self):
         """Load all cogs from the cogs directory."""
+        for cog_name in self._cog_names():
+            extension = f'cogs.{cog_name}'
+            if extension in self.bot.extensions:
+                continue  # on_ready fires again on every reconnect
+            try:
+                await self.bot.load_extension(extension)
+                self.bot.logger.info(f'Loaded cog: {cog_name}')
+            except Exception as e:
+                self.bot.logger.error(f'Failed to load cog {cog_name}: {e}', exc_info=True)
+
+    def _cog_names(self) -> list:
+        """Return the cog module names, rescanning the cogs directory only when it changed."""
         cogs_dir = os.path.join(current_dir, 'cogs')
-        for filename in os.listdir(cogs_dir):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                cog_name = filename[:-3]
-                try:
-                    await self.bot.load_extension(f'cogs.{cog_name}')
-                    self.bot.logger.info(f'Loaded cog: {cog_name}')
-                except Exception as e:
-                    self.bot.logger.error(f'Failed to load cog {cog_name}: {e}', exc_info=True)
+        mtime_ns = os.stat(cogs_dir).st_mtime_ns
+        if self._cogs_cache is None or self._cogs_cache[0] != mtime_ns:
+            with os.scandir(cogs_dir) as it:
+                names = [
+                    entry.name[:-3] for entry in it
+                    if entry.name.endswith('.py') and not entry.name.startswith('__')
+                ]
+            self._cogs_cache = (mtime_ns, names)
+        return self._cogs_cache[1]
 
     async def start(self, token: Optional[str] = None):
         """
@@ -179,7 +248,12 @@ class DiscordBot:
         self.bot.logger.info("Shutting down bot...")
         await self.bot.close()
         await self.backup_manager.stop()
+        if self._metrics_flush_task is not None:
+            self._metrics_flush_task.cancel()
+            self._metrics_flush_task = None
+        self.metrics.flush()
         self.bot.logger.info("Bot has been shut down.")
+        self._stop_log_listener()
 
     def run(self):
         """
@@ -188,6 +262,9 @@ class DiscordBot:
         This method starts the bot and handles the main event loop.
         It's used when running the bot standalone (not through GUI).
         """
+        if uvloop is not None:
+            # Only the standalone process switches loop policy; importing this module leaves it alone
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         loop = asyncio.get_event_loop()
 
         def signal_handler():
@@ -213,36 +290,50 @@ class DiscordBot:
         """Get the bot's uptime in seconds."""
         return time.time() - self.start_time
 
+    @functools.cached_property
+    def _process(self):
+        """The bot's psutil.Process, created (and psutil imported) on the first metrics read."""
+        import psutil
+        process = psutil.Process()
+        process.cpu_percent(interval=None)  # The first call only primes the counter
+        return process
+
+    @functools.cached_property
+    def _boot_time(self) -> float:
+        """System boot time, read once."""
+        import psutil
+        return psutil.boot_time()
+
     def get_memory_usage(self) -> float:
         """Get the bot's current memory usage in MB."""
-        process = psutil.Process()
-        return process.memory_info().rss / 1024 / 1024  # Convert bytes to MB
+        return self._process.memory_info().rss / 1024 / 1024  # Convert bytes to MB
 
     def get_cpu_usage(self) -> float:
-        """Get the bot's current CPU usage percentage."""
-        process = psutil.Process()
-        return process.cpu_percent(interval=1.0)
+        """Get the bot's CPU usage percentage since the previous call, without blocking."""
+        return self._process.cpu_percent(interval=None)
 
     def get_disk_io_usage(self) -> float:
         """Get the bot's disk I/O usage in bytes per second."""
+        import psutil
         disk_io = psutil.disk_io_counters()
         # Calculate bytes per second since boot
-        system_uptime = time.time() - psutil.boot_time()
+        system_uptime = time.time() - self._boot_time
         return (disk_io.read_bytes + disk_io.write_bytes) / system_uptime if system_uptime > 0 else 0.0
 
     def get_network_usage(self) -> float:
         """Get the bot's network usage in bytes per second."""
+        import psutil
         net_io = psutil.net_io_counters()
         # Calculate bytes per second since boot
-        system_uptime = time.time() - psutil.boot_time()
+        system_uptime = time.time() - self._boot_time
         return (net_io.bytes_sent + net_io.bytes_recv) / system_uptime if system_uptime > 0 else 0.0
 
     def get_thread_performance(self) -> dict:
         """Get per-thread CPU usage."""
+        import psutil
         thread_performance = {}
         try:
-            process = psutil.Process()
-            threads = process.threads()
+            threads = self._process.threads()
             for thread in threads:
                 thread_id = thread.id
                 # Note: psutil does not provide per-thread CPU percent directly.
@@ -254,6 +345,36 @@ class DiscordBot:
             self.bot.logger.error(f"Unexpected error while fetching thread performance: {e}", exc_info=True)
         return thread_performance
 
+    def snapshot_metrics(self) -> tuple:
+        """
+        Read all resource metrics in one pass.
+
+        Process-level readings share a single psutil oneshot() so /proc is read once, and
+        the expensive readings are refreshed at most every EXPENSIVE_METRICS_INTERVAL seconds.
+
+        Returns:
+            tuple: (uptime, memory MB, CPU %, disk I/O bytes/s, network bytes/s, thread CPU times).
+        """
+        with self._process.oneshot():
+            return (
+                self.get_uptime(),
+                self.get_memory_usage(),
+                self.get_cpu_usage(),
+                self._cached_metric('disk_io', self.get_disk_io_usage),
+                self._cached_metric('network', self.get_network_usage),
+                self._cached_metric('threads', self.get_thread_performance),
+            )
+
+    def _cached_metric(self, name: str, getter):
+        """Return the memoized value of an expensive metric, refreshing it once it is stale."""
+        now = time.monotonic()
+        cached = self._metrics_cache.get(name)
+        if cached is not None and now - cached[0] < EXPENSIVE_METRICS_INTERVAL:
+            return cached[1]
+        value = getter()
+        self._metrics_cache[name] = (now, value)
+        return value
+
 if __name__ == "__main__":
     try:
         # Set PYTHONIOENCODING to handle Unicode characters in console output
@@ -14,10 +14,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
-from utils.config_manager import ConfigManager, ConfigSection
+from utils.config_manager import ConfigManager
 from utils.custom_exceptions import BackupError
-import aiofiles
-import shutil
 
 class BackupManager:
     """
@@ -34,9 +32,7 @@ class BackupManager:
             config (ConfigManager): The bot's configuration manager instance.
         """
         self.config = config
-        backup_config = getattr(self.config, 'backup', {})
-        if isinstance(backup_config, ConfigSection):
-            backup_config = backup_config.to_dict()
+        backup_config = self.config.section('backup')
 
         self.backup_dir = backup_config.get('directory', 'backups')
         self.backup_interval = backup_config.get('interval', 24) * 3600  # Default to 24 hours
@@ -51,6 +47,7 @@ class BackupManager:
         os.makedirs(self.backup_dir, exist_ok=True)
         self.logger = logging.getLogger('backup_manager')
         self._stop_event = asyncio.Event()
+        self._cleanup_task = None
 
     async def create_backup(self) -> None:
         """
@@ -74,20 +71,26 @@ class BackupManager:
             raise BackupError(f"Failed to create backup: {e}") from e
 
     async def _write_backup(self, backup_path: str):
-        """Asynchronous method to write backup using aiofiles and zipfile."""
-        loop = asyncio.get_event_loop()
-        async with aiofiles.tempfile.TemporaryDirectory() as temp_dir:
-            # Copy files to temporary directory
-            for file_path in self.backup_files:
-                if os.path.exists(file_path):
-                    dest_path = os.path.join(temp_dir, os.path.basename(file_path))
-                    await loop.run_in_executor(None, shutil.copy2, file_path, dest_path)
-                    self.logger.info(f"Added {file_path} to backup.")
-                else:
-                    self.logger.warning(f"File not found: {file_path}")
-
-            # Create zip archive from the temporary directory
-            await loop.run_in_executor(None, shutil.make_archive, backup_path.replace('.zip', ''), 'zip', temp_dir)
+        """Write the backup in a single worker thread, so the event loop is only left once."""
+        await asyncio.to_thread(self._build_archive, backup_path)
+
+    def _build_archive(self, backup_path: str):
+        """Stream the backup files straight into the zip archive. Blocking."""
+        # Written under a temporary name so a half-written archive never looks like a backup
+        partial_path = f"{backup_path}.part"
+        try:
+            with zipfile.ZipFile(partial_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as backup_zip:
+                for file_path in self.backup_files:
+                    if os.path.exists(file_path):
+                        backup_zip.write(file_path, os.path.basename(file_path))
+                        self.logger.info(f"Added {file_path} to backup.")
+                    else:
+                        self.logger.warning(f"File not found: {file_path}")
+            os.replace(partial_path, backup_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
 
     async def run_periodic_backup(self) -> None:
         """
@@ -99,7 +102,9 @@ class BackupManager:
         while not self._stop_event.is_set():
             try:
                 await self.create_backup()
-                await self.cleanup_old_backups()
+                # Clean up in the background so the wait for the next backup starts right away
+                if self._cleanup_task is None or self._cleanup_task.done():
+                    self._cleanup_task = asyncio.create_task(self._background_cleanup())
             except Exception as e:
                 self.logger.error(f"Error in periodic backup: {e}", exc_info=True)
             try:
@@ -108,11 +113,19 @@ class BackupManager:
             except asyncio.TimeoutError:
                 continue  # Timeout means it's time to perform the next backup
 
+    async def _background_cleanup(self):
+        try:
+            await self.cleanup_old_backups()
+        except BackupError:
+            pass  # Already logged by cleanup_old_backups
+
     async def stop(self):
         """
         Stop the periodic backup task.
         """
         self._stop_event.set()
+        if self._cleanup_task is not None:
+            await asyncio.gather(self._cleanup_task, return_exceptions=True)
 
     async def list_backups(self) -> List[str]:
         """
@@ -122,16 +135,21 @@ class BackupManager:
             List[str]: A list of backup filenames.
         """
         try:
-            backups = [
-                f for f in os.listdir(self.backup_dir)
-                if f.startswith("backup_") and f.endswith(".zip")
-            ]
-            backups.sort(reverse=True)
-            return backups
+            return await asyncio.to_thread(self._scan_backups)
         except Exception as e:
             self.logger.error(f"Failed to list backups: {e}", exc_info=True)
             raise BackupError(f"Failed to list backups: {e}") from e
 
+    def _scan_backups(self) -> List[str]:
+        """Return backup filenames, newest first. Blocking."""
+        with os.scandir(self.backup_dir) as it:
+            backups = [
+                entry.name for entry in it
+                if entry.name.startswith("backup_") and entry.name.endswith(".zip")
+            ]
+        backups.sort(reverse=True)
+        return backups
+
     async def restore_backup(self, backup_filename: str) -> None:
         """
         Restore a specific backup.
@@ -151,30 +169,40 @@ class BackupManager:
             raise BackupError(f"Failed to restore backup: {e}") from e
 
     async def _restore_backup(self, backup_path: str):
-        """Asynchronous method to restore backup using aiofiles and zipfile."""
-        loop = asyncio.get_event_loop()
+        """Extract the backup archive in a worker thread."""
+        await asyncio.to_thread(self._extract_archive, backup_path)
+
+    def _extract_archive(self, backup_path: str):
+        """Extract the backup archive into the backup directory. Blocking."""
         with zipfile.ZipFile(backup_path, 'r') as backup_zip:
-            await loop.run_in_executor(None, backup_zip.extractall, self.backup_dir)
+            backup_zip.extractall(self.backup_dir)
 
     async def cleanup_old_backups(self) -> None:
         """
         Remove old backups based on max_backups and max_backup_age.
         """
         try:
-            backups = await self.list_backups()
-            # Remove backups exceeding max_backups
-            for old_backup in backups[self.max_backups:]:
-                os.remove(os.path.join(self.backup_dir, old_backup))
-                self.logger.info(f"Removed old backup: {old_backup}")
-
-            # Remove backups older than max_backup_age
-            cutoff_date = datetime.now() - timedelta(days=self.max_backup_age)
-            for backup in backups:
-                backup_path = os.path.join(self.backup_dir, backup)
-                modified_time = datetime.fromtimestamp(os.path.getmtime(backup_path))
-                if modified_time < cutoff_date:
-                    os.remove(backup_path)
-                    self.logger.info(f"Removed expired backup: {backup}")
+            await asyncio.to_thread(self._remove_old_backups)
         except Exception as e:
             self.logger.error(f"Failed to clean up old backups: {e}", exc_info=True)
-            raise BackupError(f"Failed to clean up old backups: {e}") from e
\ No newline at end of file
+            raise BackupError(f"Failed to clean up old backups: {e}") from e
+
+    def _remove_old_backups(self):
+        """Delete backups past max_backups or max_backup_age in one directory scan. Blocking."""
+        with os.scandir(self.backup_dir) as it:
+            # DirEntry.path is already joined with the backup directory
+            entries = [
+                (entry.name, entry.stat().st_mtime, entry.path) for entry in it
+                if entry.name.startswith("backup_") and entry.name.endswith(".zip")
+            ]
+        # Newest first; the timestamped names sort chronologically, as in list_backups
+        entries.sort(reverse=True)
+
+        cutoff = (datetime.now() - timedelta(days=self.max_backup_age)).timestamp()
+        for index, (name, mtime, path) in enumerate(entries):
+            if index >= self.max_backups:
+                os.remove(path)
+                self.logger.info(f"Removed old backup: {name}")
+            elif mtime < cutoff:
+                os.remove(path)
+                self.logger.info(f"Removed expired backup: {name}")
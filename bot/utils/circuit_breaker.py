@@ -9,7 +9,6 @@ It helps to prevent cascading failures and allows the system to recover from err
 
 import time
 from enum import Enum
-import asyncio
 
 from utils.custom_exceptions import CircuitBreakerError
 
@@ -24,7 +23,7 @@ class CircuitBreaker:
     Implementation of the Circuit Breaker pattern.
     """
 
-    __slots__ = ('failure_threshold', 'recovery_time', 'reset_timeout', 'state', 'failures', 'last_failure_time', '_lock')
+    __slots__ = ('failure_threshold', 'recovery_time', 'reset_timeout', 'state', 'failures', 'last_failure_time')
 
     def __init__(self, failure_threshold: int, recovery_time: float, reset_timeout: float = 60.0):
         """
@@ -40,56 +39,54 @@ class CircuitBreaker:
         self.reset_timeout = reset_timeout
         self.state = CircuitState.CLOSED
         self.failures = 0
-        self.last_failure_time = None
-        self._lock = asyncio.Lock()
+        self.last_failure_time = None  # time.monotonic() of the last failure
 
     async def call(self, func, *args, **kwargs):
         """
         Execute a function with circuit breaker protection.
-        """
-        async with self._lock:
-            if self.state == CircuitState.OPEN:
-                current_time = time.time()
-                if current_time - self.last_failure_time >= self.recovery_time:
-                    self.state = CircuitState.HALF_OPEN
-                else:
-                    raise CircuitBreakerError("Circuit is open. Requests are temporarily blocked.")
 
-            elif self.state == CircuitState.CLOSED:
-                self._reset_failure_count_if_needed()
+        No lock is needed: state is only touched by synchronous code between awaits, which
+        the event loop never interleaves.
+        """
+        state = self.state
+        if state is CircuitState.OPEN:
+            if time.monotonic() - self.last_failure_time >= self.recovery_time:
+                self.state = CircuitState.HALF_OPEN
+            else:
+                raise CircuitBreakerError("Circuit is open. Requests are temporarily blocked.")
+        elif state is CircuitState.CLOSED and self.last_failure_time is not None:
+            self._reset_failure_count_if_needed()
 
         try:
             result = await func(*args, **kwargs)
-            if self.state == CircuitState.HALF_OPEN:
-                await self._reset()
-            return result
-        except Exception as e:
-            await self._record_failure()
-            raise e
+        except Exception:
+            self._record_failure()
+            raise
+        if self.state is CircuitState.HALF_OPEN:
+            self._reset()
+        return result
 
-    async def _record_failure(self):
+    def _record_failure(self):
         """
         Record a failure and potentially open the circuit.
         """
-        async with self._lock:
-            self.failures += 1
-            self.last_failure_time = time.time()
-            if self.failures >= self.failure_threshold:
-                self.state = CircuitState.OPEN
+        self.failures += 1
+        self.last_failure_time = time.monotonic()
+        if self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
 
-    async def _reset(self):
+    def _reset(self):
         """
         Reset the circuit breaker to its initial closed state.
         """
-        async with self._lock:
-            self.failures = 0
-            self.state = CircuitState.CLOSED
-            self.last_failure_time = None
+        self.failures = 0
+        self.state = CircuitState.CLOSED
+        self.last_failure_time = None
 
     def _reset_failure_count_if_needed(self):
         """
         Reset the failure count if the reset timeout has expired.
         """
-        if self.last_failure_time and (time.time() - self.last_failure_time) >= self.reset_timeout:
+        if self.last_failure_time is not None and (time.monotonic() - self.last_failure_time) >= self.reset_timeout:
             self.failures = 0
             self.last_failure_time = None
\ No newline at end of file
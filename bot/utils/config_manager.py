@@ -2,31 +2,86 @@
 
 import yaml
 import os
+import asyncio
 import threading
+import hashlib
+import json
 import re
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 
+try:
+    # libyaml-backed loader/dumper, if PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson  # Faster (de)serialization of the config snapshot, if available
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Environment variable references in the form ${VARIABLE_NAME}
+_ENV_RE = re.compile(r'\$\{(\w+)\}')
+
+
+def _resolve_env_var(match: 're.Match') -> str:
+    env_value = os.environ.get(match.group(1))
+    if env_value is None:
+        raise ValueError(f"Environment variable '{match.group(1)}' not found.")
+    return env_value
+
+
+# Keys containing any of these (case-insensitively) have their string values redacted
+_SENSITIVE_KEY_PARTS = ('token', 'secret', 'password', 'api_key')
+
+
+@lru_cache(maxsize=None)
+def _is_sensitive_key(key: str) -> bool:
+    lowered = key.lower()
+    return any(part in lowered for part in _SENSITIVE_KEY_PARTS)
+
 class ConfigSection:
     """
     A helper class for accessing configuration sections with attribute-style access.
+
+    Nested sections are wrapped lazily, the first time they are accessed.
     """
 
-    __slots__ = ('_parent', '_data', '_name', '_config')
+    __slots__ = ('_parent', '_data', '_name', '_config', '_children', '_path')
 
     def __init__(self, parent, data: Dict[str, Any], name: str, config_ref: Dict[str, Any]):
         self._parent = parent
         self._data = data
         self._name = name
         self._config = config_ref  # Reference to the main config dict
-        self._parse_section(data)
-
-    def _parse_section(self, section: Dict[str, Any]):
-        for key, value in section.items():
-            if isinstance(value, dict):
-                setattr(self, key, ConfigSection(self, value, key, self._config))
-            else:
-                setattr(self, key, value)
+        self._children = {}  # key -> ConfigSection wrapping a nested dict
+        # Keys leading from the main config dict to this section
+        self._path = parent._path + (name,) if isinstance(parent, ConfigSection) else (name,)
+
+    def __getattr__(self, key: str) -> Any:
+        # Only called for names that are not slots or methods
+        if key in ConfigSection.__slots__:
+            raise AttributeError(key)
+        try:
+            value = self._data[key]
+        except KeyError:
+            raise AttributeError(f"Config section '{self._name}' has no key '{key}'") from None
+        if isinstance(value, dict):
+            child = self._children.get(key)
+            if child is None or child._data is not value:
+                child = self._children[key] = ConfigSection(self, value, key, self._config)
+            return child
+        return value
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -38,23 +93,14 @@ class ConfigSection:
         """
         Set a configuration value in this section.
         """
-        setattr(self, key, value)
         self._data[key] = value
+        self._children.pop(key, None)
         # Update the main config dict
         current = self._config
-        keys = self._get_hierarchy_keys()
-        for k in keys:
+        for k in self._path:
             current = current.setdefault(k, {})
         current[key] = value
 
-    def _get_hierarchy_keys(self):
-        keys = []
-        current = self
-        while isinstance(current, ConfigSection):
-            keys.insert(0, current._name)
-            current = current._parent
-        return keys
-
     def to_dict(self, sanitize_func=lambda x: x) -> Dict[str, Any]:
         """Convert the ConfigSection and its children to a dictionary."""
         result = {}
@@ -64,7 +110,7 @@ class ConfigSection:
                 result[key] = val.to_dict(sanitize_func)
             elif isinstance(val, dict):
                 result[key] = {k: sanitize_func(v) for k, v in val.items()}
-            elif isinstance(val, str) and 'token' in key.lower():
+            elif isinstance(val, str) and _is_sensitive_key(key):
                 result[key] = '***REDACTED***'
             else:
                 result[key] = sanitize_func(val)
@@ -77,12 +123,36 @@ class ConfigSection:
         return f"<ConfigSection {self._name}>"
 
 
+class _EmptySection:
+    """
+    Stand-in for a missing configuration section; every lookup returns its default.
+    """
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return default
+
+    def to_dict(self, sanitize_func=lambda x: x) -> Dict[str, Any]:
+        return {}
+
+    def __getitem__(self, item):
+        return None
+
+    def __repr__(self):
+        return "<ConfigSection (empty)>"
+
+
+# Shared by every caller asking for a section that isn't configured
+_EMPTY_SECTION = _EmptySection()
+
+
 class ConfigManager:
     """
     A class for managing bot configuration.
     """
 
-    __slots__ = ('_config', '_config_filename', '_config_lock', '_sections', '_initialized')
+    __slots__ = ('_config', '_config_filename', '_config_lock', '_config_stat', '_sections', '_initialized')
 
     _instance = None
     _instance_lock = threading.Lock()
@@ -105,75 +175,142 @@ class ConfigManager:
         self._initialized = True
         self._config_filename = config_filename
         self._config_lock = threading.Lock()
+        self._config_stat = None  # (st_mtime_ns, st_size) of the file as last read or saved
         self._sections = {}
         self.reload()
 
-    def reload(self):
+    def _config_path(self, config_filename: Optional[str] = None) -> str:
+        """
+        Return the absolute path of a configuration file in the project's config directory.
+        """
+        script_path = os.path.abspath(__file__)
+        project_root = os.path.abspath(os.path.join(script_path, '..', '..'))
+        return os.path.join(project_root, 'config', config_filename or self._config_filename)
+
+    @staticmethod
+    def _stat_key(config_path: str):
+        st = os.stat(config_path)
+        return st.st_mtime_ns, st.st_size
+
+    def reload(self, force: bool = False) -> bool:
         """
         Reload configuration from the YAML file.
+
+        The file is only re-read if its modification time or size changed since it was
+        last read or saved, unless `force` is set.
+
+        Returns:
+            bool: True if the configuration was reloaded, False if it was already current.
         """
+        config_path = self._config_path()
+
+        try:
+            stat_key = self._stat_key(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+        if not force and stat_key == self._config_stat:
+            return False
+
         # Load environment variables from .env file
         load_dotenv()
-        # Load environment variables into a dictionary
-        self._env_vars = {key: os.getenv(key) for key in os.environ.keys()}
-
-        # Determine the absolute path to the configuration file
-        script_path = os.path.abspath(__file__)
-        project_root = os.path.abspath(os.path.join(script_path, '..', '..'))
-        config_path = os.path.join(project_root, 'config', self._config_filename)
 
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        # Build the new configuration off to the side; readers keep using the old one meanwhile
+        config_dict = self._load_yaml(config_path)
+        if config_dict is None:
+            raise ValueError("Configuration file is empty or invalid.")
+        config_dict = self._replace_env_variables(config_dict)
 
         with self._config_lock:
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config_dict = yaml.safe_load(f)
-                if config_dict is None:
-                    raise ValueError("Configuration file is empty or invalid.")
+            # A single reference swap publishes it; section wrappers are rebuilt on first access
+            self._config = config_dict
+            self._sections = {}
+            self._config_stat = stat_key
+        return True
+
+    @staticmethod
+    def _load_yaml(config_path: str) -> Any:
+        """
+        Parse the YAML file, reusing a JSON snapshot of the previous parse if the file is unchanged.
 
-                # Replace environment variables and parse the configuration
-                self._config = self._replace_env_variables(config_dict)
-                self._parse_config(self._config)
-            except yaml.YAMLError as e:
-                raise yaml.YAMLError(f"Error parsing configuration file: {str(e)}") from e
+        The snapshot is keyed on a hash of the file's contents, not its timestamps, so an
+        edit or restore that keeps the mtime and size can't bring back a stale parse.
+        It holds the raw YAML data, before environment variable substitution, so
+        secrets from the environment are never written to disk. It is plain data, so a
+        tampered snapshot can at worst change config values, never run code.
+        """
+        with open(config_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+        cache_path = f"{config_path}.cache.json"
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_digest, cached_config = _json_loads(f.read())
+            if cached_digest == digest:
+                return cached_config
+        except (OSError, ValueError, TypeError):
+            pass  # Missing or unreadable snapshot; fall back to parsing
+
+        try:
+            config_dict = yaml.load(raw, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"Error parsing configuration file: {str(e)}") from e
+
+        if config_dict is not None:
+            try:
+                snapshot = _json_dumps((digest, config_dict))
+                # Only keep snapshots that round-trip exactly (no dates, non-string keys, ...)
+                if _json_loads(snapshot)[1] == config_dict:
+                    temp_path = f"{cache_path}.tmp"
+                    with open(temp_path, 'wb') as f:
+                        f.write(snapshot)
+                    os.replace(temp_path, cache_path)
+            except (OSError, ValueError, TypeError):
+                pass  # The snapshot is only an optimization
+        return config_dict
 
     def _replace_env_variables(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively replace environment variables in the configuration dictionary.
+        Replace environment variables in the configuration dictionary, nested sections included.
         """
-        for key, value in config.items():
-            if isinstance(value, dict):
-                config[key] = self._replace_env_variables(value)
-            elif isinstance(value, str):
-                # Replace environment variables in the form ${VARIABLE_NAME}
-                config[key] = self._substitute_env_vars(value)
+        stack = [config]
+        while stack:
+            section = stack.pop()
+            for key, value in section.items():
+                if isinstance(value, dict):
+                    stack.append(value)
+                elif isinstance(value, str) and '${' in value:
+                    # Replace environment variables in the form ${VARIABLE_NAME}
+                    section[key] = self._substitute_env_vars(value)
         return config
 
-    def _substitute_env_vars(self, value: str) -> str:
+    @staticmethod
+    def _substitute_env_vars(value: str) -> str:
         """
         Substitute environment variables in a string.
         """
-        env_var_pattern = re.compile(r'\$\{(\w+)\}')
-        matches = env_var_pattern.findall(value)
-        for var in matches:
-            env_value = os.getenv(var)
-            if env_value is None:
-                raise ValueError(f"Environment variable '{var}' not found.")
-            value = value.replace(f'${{{var}}}', env_value)
-        return value
+        return _ENV_RE.sub(_resolve_env_var, value)
 
-    def _parse_config(self, config: Dict[str, Any]):
+    def __getattr__(self, key: str) -> Any:
         """
-        Recursively set attributes from the configuration dictionary.
+        Look up a top-level configuration value, wrapping sections in a ConfigSection.
+
+        Lock-free: reads see either the previous or the reloaded configuration, never a mix.
         """
-        for key, value in config.items():
-            if isinstance(value, dict):
-                section = ConfigSection(self, value, key, self._config)
-                setattr(self, key, section)
-                self._sections[key] = section
-            else:
-                setattr(self, key, value)
+        # Only called for names that are not slots or methods
+        if key in ConfigManager.__slots__:
+            raise AttributeError(key)
+        config = self._config
+        try:
+            value = config[key]
+        except KeyError:
+            raise AttributeError(f"Configuration has no key '{key}'") from None
+        if isinstance(value, dict):
+            section = self._sections.get(key)
+            if section is None or section._data is not value:
+                section = self._sections[key] = ConfigSection(self, value, key, config)
+            return section
+        return value
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -181,28 +318,43 @@ class ConfigManager:
         """
         return getattr(self, key, default)
 
+    def section(self, key: str):
+        """
+        Get a configuration section, or a shared empty section if it is missing.
+
+        Both support `get()` with a default, so callers need no fallback of their own.
+        """
+        value = getattr(self, key, None)
+        return value if isinstance(value, ConfigSection) else _EMPTY_SECTION
+
     def set(self, key: str, value: Any):
         """
         Set a configuration value.
         """
-        setattr(self, key, value)
         self._config[key] = value
+        self._sections.pop(key, None)
 
     async def save(self, config_filename: Optional[str] = None):
         """
         Save the current configuration back to the YAML file asynchronously.
+
+        The write runs in a worker thread; see `save_sync`.
         """
-        if config_filename is None:
-            config_filename = self._config_filename
+        await asyncio.to_thread(self.save_sync, config_filename)
 
-        script_path = os.path.abspath(__file__)
-        project_root = os.path.abspath(os.path.join(script_path, '..', '..'))
-        config_path = os.path.join(project_root, 'config', config_filename)
+    def save_sync(self, config_filename: Optional[str] = None):
+        """
+        Save the current configuration back to the YAML file, blocking until it is written.
+        """
+        config_path = self._config_path(config_filename)
 
         with self._config_lock:
-            from aiofile import async_open
-            async with async_open(config_path, 'w', encoding='utf-8') as f:
-                await f.write(yaml.dump(self._config, default_flow_style=False, allow_unicode=True))
+            text = yaml.dump(self._config, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
+            with open(config_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            if config_filename in (None, self._config_filename):
+                # The file now matches memory, so the next reload can skip it
+                self._config_stat = self._stat_key(config_path)
 
     def get_safe_config(self) -> Dict[str, Any]:
         """
@@ -213,7 +365,7 @@ class ConfigManager:
             value = getattr(self, key)
             if isinstance(value, ConfigSection):
                 result[key] = value.to_dict()
-            elif isinstance(value, str) and 'token' in key.lower():
+            elif isinstance(value, str) and _is_sensitive_key(key):
                 result[key] = '***REDACTED***'
             else:
                 result[key] = value
@@ -2,25 +2,120 @@
 Metrics Collector for Discord Bot.
 
 This module provides functionality for collecting and recording various bot metrics.
-It uses Prometheus client library for metrics.
+It uses Prometheus client library for metrics, imported on first use; without it,
+metrics are silently discarded.
 """
 
 import time
 import asyncio
-from functools import wraps
-from typing import Callable, Any
-from prometheus_client import Counter, Histogram, Gauge
-
-# Define metrics
-MESSAGE_COUNTER = Counter('bot_messages_processed', 'Number of messages processed')
-COMMAND_COUNTER = Counter('bot_commands_executed', 'Number of commands executed', ['command'])
-API_LATENCY = Histogram('bot_api_latency_seconds', 'Latency of API calls in seconds', ['api'])
-THREAD_GAUGE = Gauge('bot_active_threads', 'Number of active threads being monitored')
-CENSORED_MESSAGES = Counter('bot_censored_messages', 'Number of messages censored')
-PLUGIN_ERRORS = Counter('bot_plugin_errors', 'Number of plugin errors', ['plugin'])
-DB_QUERY_LATENCY = Histogram('bot_db_query_latency_seconds', 'Latency of database queries in seconds')
-MEMORY_USAGE = Gauge('bot_memory_usage_bytes', 'Memory usage of the bot in bytes')
-CPU_USAGE = Gauge('bot_cpu_usage_percent', 'CPU usage of the bot as a percentage')
+from functools import wraps, lru_cache
+from types import SimpleNamespace
+from typing import Callable, Any, Dict
+
+class _NullMetric:
+    """Stand-in for every metric type when prometheus_client is not installed."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        pass
+
+    def labels(self, *args: Any, **kwargs: Any) -> '_NullMetric':
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+@lru_cache(maxsize=None)
+def _metrics() -> SimpleNamespace:
+    """
+    Define the metrics on first use, so prometheus_client is only imported when metrics are recorded.
+    """
+    try:
+        from prometheus_client import Counter, Histogram, Gauge
+    except ImportError:
+        Counter = Histogram = Gauge = _NullMetric
+    return SimpleNamespace(
+        MESSAGE_COUNTER=Counter('bot_messages_processed', 'Number of messages processed'),
+        COMMAND_COUNTER=Counter('bot_commands_executed', 'Number of commands executed', ['command']),
+        # Latency histograms use short bucket lists sized to realistic API / SQLite latencies
+        API_LATENCY=Histogram(
+            'bot_api_latency_seconds', 'Latency of API calls in seconds', ['api'],
+            buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+        ),
+        THREAD_GAUGE=Gauge('bot_active_threads', 'Number of active threads being monitored'),
+        CENSORED_MESSAGES=Counter('bot_censored_messages', 'Number of messages censored'),
+        PLUGIN_ERRORS=Counter('bot_plugin_errors', 'Number of plugin errors', ['plugin']),
+        DB_QUERY_LATENCY=Histogram(
+            'bot_db_query_latency_seconds', 'Latency of database queries in seconds',
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+        ),
+        MEMORY_USAGE=Gauge('bot_memory_usage_bytes', 'Memory usage of the bot in bytes'),
+        CPU_USAGE=Gauge('bot_cpu_usage_percent', 'CPU usage of the bot as a percentage'),
+    )
+
+def __getattr__(name: str) -> Any:
+    # Module-level access such as metrics.MESSAGE_COUNTER still works, defining the metrics if needed
+    if name.isupper():
+        try:
+            return getattr(_metrics(), name)
+        except AttributeError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Labelled children by label value, so the hot path skips the locked labels() lookup
+_COMMAND_COUNTERS: Dict[str, Any] = {}
+_PLUGIN_ERROR_COUNTERS: Dict[str, Any] = {}
+
+# Per-message increments buffered in process and pushed to their counters by flush().
+# Only touched from the event loop thread, so plain integer updates are enough.
+_PENDING_COUNTS: Dict[str, int] = {'messages': 0, 'censored': 0}
+_BUFFERED_COUNTERS = {'messages': 'MESSAGE_COUNTER', 'censored': 'CENSORED_MESSAGES'}
+
+# When False, the latency decorators call straight through without timing anything
+_latency_enabled = True
+
+def _timed(func: Callable, resolve_observe: Callable[[], Callable[[float], None]]) -> Callable:
+    """
+    Wrap `func` so each call's duration is passed to an observe callable.
+
+    `resolve_observe` is only called on the first timed call and its result reused, so
+    decorating a function at import time doesn't load prometheus_client.
+    Only the wrapper matching `func` (coroutine function or not) is built.
+    """
+    perf_counter = time.perf_counter  # Closure variable, not a module attribute lookup per call
+    observe = None
+
+    def record(elapsed: float) -> None:
+        nonlocal observe
+        if observe is None:
+            observe = resolve_observe()
+        observe(elapsed)
+
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _latency_enabled:
+                return await func(*args, **kwargs)
+            start_time = perf_counter()
+            result = await func(*args, **kwargs)
+            record(perf_counter() - start_time)
+            return result
+        return async_wrapper
+
+    @wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _latency_enabled:
+            return func(*args, **kwargs)
+        start_time = perf_counter()
+        result = func(*args, **kwargs)
+        record(perf_counter() - start_time)
+        return result
+    return sync_wrapper
 
 class MetricsCollector:
     """
@@ -30,10 +125,21 @@ class MetricsCollector:
     recording latencies, and updating gauges.
     """
 
+    @staticmethod
+    def set_latency_enabled(enabled: bool) -> None:
+        """
+        Enable or disable latency recording by the record_* decorators.
+
+        Args:
+            enabled (bool): Whether decorated calls should be timed.
+        """
+        global _latency_enabled
+        _latency_enabled = bool(enabled)
+
     @staticmethod
     def increment_message() -> None:
-        """Increment the counter for processed messages."""
-        MESSAGE_COUNTER.inc()
+        """Increment the counter for processed messages (buffered until the next flush)."""
+        _PENDING_COUNTS['messages'] += 1
 
     @staticmethod
     def increment_command(command_name: str) -> None:
@@ -43,7 +149,10 @@ class MetricsCollector:
         Args:
             command_name (str): The name of the command executed.
         """
-        COMMAND_COUNTER.labels(command=command_name).inc()
+        counter = _COMMAND_COUNTERS.get(command_name)
+        if counter is None:
+            counter = _COMMAND_COUNTERS[command_name] = _metrics().COMMAND_COUNTER.labels(command=command_name)
+        counter.inc()
 
     @staticmethod
     def record_api_latency(api_name: str):
@@ -57,26 +166,8 @@ class MetricsCollector:
             Callable: Decorated function that records API latency.
         """
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start_time = time.perf_counter()
-                result = await func(*args, **kwargs)
-                latency = time.perf_counter() - start_time
-                API_LATENCY.labels(api=api_name).observe(latency)
-                return result
-
-            @wraps(func)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start_time = time.perf_counter()
-                result = func(*args, **kwargs)
-                latency = time.perf_counter() - start_time
-                API_LATENCY.labels(api=api_name).observe(latency)
-                return result
-
-            if asyncio.iscoroutinefunction(func):
-                return async_wrapper
-            else:
-                return sync_wrapper
+            # The labelled child is resolved once per decorated function, on its first call
+            return _timed(func, lambda: _metrics().API_LATENCY.labels(api=api_name).observe)
 
         return decorator
 
@@ -88,12 +179,35 @@ class MetricsCollector:
         Args:
             count (int): The number of active threads.
         """
-        THREAD_GAUGE.set(count)
+        _metrics().THREAD_GAUGE.set(count)
 
     @staticmethod
     def increment_censored_message() -> None:
-        """Increment the counter for censored messages."""
-        CENSORED_MESSAGES.inc()
+        """Increment the counter for censored messages (buffered until the next flush)."""
+        _PENDING_COUNTS['censored'] += 1
+
+    @staticmethod
+    def flush() -> None:
+        """Push buffered per-message increments to their Prometheus counters, one inc() each."""
+        for name, count in _PENDING_COUNTS.items():
+            if count:
+                _PENDING_COUNTS[name] = 0
+                getattr(_metrics(), _BUFFERED_COUNTERS[name]).inc(count)
+
+    @staticmethod
+    async def flush_loop(interval: float) -> None:
+        """
+        Flush buffered increments every `interval` seconds until cancelled.
+
+        Args:
+            interval (float): Seconds between flushes.
+        """
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                MetricsCollector.flush()
+        finally:
+            MetricsCollector.flush()
 
     @staticmethod
     def increment_plugin_error(plugin_name: str) -> None:
@@ -103,7 +217,10 @@ class MetricsCollector:
         Args:
             plugin_name (str): The name of the plugin that encountered an error.
         """
-        PLUGIN_ERRORS.labels(plugin=plugin_name).inc()
+        counter = _PLUGIN_ERROR_COUNTERS.get(plugin_name)
+        if counter is None:
+            counter = _PLUGIN_ERROR_COUNTERS[plugin_name] = _metrics().PLUGIN_ERRORS.labels(plugin=plugin_name)
+        counter.inc()
 
     @staticmethod
     def record_db_query_latency():
@@ -114,26 +231,7 @@ class MetricsCollector:
             Callable: Decorated function that records database query latency.
         """
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start_time = time.perf_counter()
-                result = await func(*args, **kwargs)
-                latency = time.perf_counter() - start_time
-                DB_QUERY_LATENCY.observe(latency)
-                return result
-
-            @wraps(func)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                start_time = time.perf_counter()
-                result = func(*args, **kwargs)
-                latency = time.perf_counter() - start_time
-                DB_QUERY_LATENCY.observe(latency)
-                return result
-
-            if asyncio.iscoroutinefunction(func):
-                return async_wrapper
-            else:
-                return sync_wrapper
+            return _timed(func, lambda: _metrics().DB_QUERY_LATENCY.observe)
 
         return decorator
 
@@ -145,7 +243,7 @@ class MetricsCollector:
         Args:
             usage_bytes (float): The memory usage in bytes.
         """
-        MEMORY_USAGE.set(usage_bytes)
+        _metrics().MEMORY_USAGE.set(usage_bytes)
 
     @staticmethod
     def set_cpu_usage(usage_percent: float) -> None:
@@ -155,4 +253,4 @@ class MetricsCollector:
         Args:
             usage_percent (float): The CPU usage as a percentage.
         """
-        CPU_USAGE.set(usage_percent)
\ No newline at end of file
+        _metrics().CPU_USAGE.set(usage_percent)
\ No newline at end of file
@@ -6,14 +6,29 @@ It includes a PluginManager class that handles plugin operations.
 """
 
 import importlib
+import sys
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from discord.ext import commands
 import os
 import logging
 
 from utils.custom_exceptions import PluginError
 
+try:
+    # libyaml-backed loader, if PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Resolved once at import rather than per PluginManager
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PLUGIN_DIR = os.path.normpath(os.path.join(_MODULE_DIR, '..', 'plugins'))
+_PLUGIN_CONFIG_PATH = os.path.normpath(os.path.join(_MODULE_DIR, '..', '..', 'config', 'plugins.yaml'))
+
+# Parsed plugin config by absolute path, as (st_mtime_ns, config); reused while the file is unchanged
+_PLUGIN_CONFIG_CACHE: Dict[str, tuple] = {}
+
 class PluginManager:
     """
     A class for managing bot plugins.
@@ -30,11 +45,13 @@ class PluginManager:
         """
         self.bot = bot
         self.plugins: Dict[str, Any] = {}
+        # Names of the cogs each loaded plugin registered, so unloading needn't scan every cog
+        self._plugin_cogs: Dict[str, List[str]] = {}
         self.logger = logging.getLogger('plugin_manager')
 
         # Load the plugin configuration from the YAML file
         self.plugin_config = self._load_plugin_config()
-        self.plugin_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'plugins')
+        self.plugin_directory = _PLUGIN_DIR
 
     def _load_plugin_config(self) -> Dict[str, Any]:
         """
@@ -46,12 +63,16 @@ class PluginManager:
         Raises:
             PluginError: If the configuration file is missing or malformed.
         """
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(script_dir, '..', '..'))
-        config_path = os.path.join(project_root, 'config', 'plugins.yaml')
+        config_path = _PLUGIN_CONFIG_PATH
         try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            cached = _PLUGIN_CONFIG_CACHE.get(config_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
             with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+                plugin_config = yaml.load(f, Loader=_YamlLoader)
+            _PLUGIN_CONFIG_CACHE[config_path] = (mtime_ns, plugin_config)
+            return plugin_config
         except FileNotFoundError:
             self.logger.warning(f"Plugin configuration file not found at {config_path}. Using default configuration.")
             return {'enabled_plugins': []}
@@ -87,11 +108,17 @@ class PluginManager:
             raise PluginError(f"Plugin '{plugin_name}' is already loaded.")
         module_name = f'plugins.{plugin_name}'
         try:
-            module = importlib.import_module(module_name)
-            importlib.reload(module)  # Ensure fresh import
+            existing = sys.modules.get(module_name)
+            if existing is not None:
+                module = importlib.reload(existing)  # Pick up changes since it was last loaded
+            else:
+                module = importlib.import_module(module_name)
             if hasattr(module, 'setup'):
                 await module.setup(self.bot)
                 self.plugins[plugin_name] = module
+                self._plugin_cogs[plugin_name] = [
+                    cog_name for cog_name, cog in self.bot.cogs.items() if cog.__module__ == module.__name__
+                ]
                 self.logger.info(f"Loaded plugin: {plugin_name}")
             else:
                 raise PluginError(f"Plugin '{plugin_name}' does not have a setup function.")
@@ -115,8 +142,7 @@ class PluginManager:
             raise PluginError(f"Plugin '{plugin_name}' is not loaded.")
         try:
             # Remove all cogs associated with this plugin
-            cogs_to_remove = [cog_name for cog_name, cog in self.bot.cogs.items() if cog.__module__ == module.__name__]
-            for cog_name in cogs_to_remove:
+            for cog_name in self._plugin_cogs.pop(plugin_name, ()):
                 await self.bot.remove_cog(cog_name)
 
             del self.plugins[plugin_name]
@@ -135,6 +161,8 @@ class PluginManager:
             PluginError: If there's an error during the reload process.
         """
         await self.unload_plugin(plugin_name)
+        # Drop the old module so load_plugin executes the source once, as a fresh import
+        sys.modules.pop(f'plugins.{plugin_name}', None)
         importlib.invalidate_caches()
         try:
             await self.load_plugin(plugin_name)
@@ -162,12 +190,14 @@ class PluginManager:
             Dict[str, str]: A dictionary with plugin names as keys and their status as values.
         """
         plugins = {}
-        if os.path.exists(self.plugin_directory):
-            for filename in os.listdir(self.plugin_directory):
-                if filename.endswith('.py') and not filename.startswith('__'):
-                    plugin_name = filename[:-3]
-                    status = 'Loaded' if plugin_name in self.plugins else 'Not Loaded'
-                    plugins[plugin_name] = status
-        else:
+        try:
+            with os.scandir(self.plugin_directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith('.py') and not name.startswith('__') and entry.is_file():
+                        plugin_name = name[:-3]
+                        status = 'Loaded' if plugin_name in self.plugins else 'Not Loaded'
+                        plugins[plugin_name] = status
+        except FileNotFoundError:
             self.logger.warning(f"Plugins directory not found at {self.plugin_directory}")
         return plugins
\ No newline at end of file
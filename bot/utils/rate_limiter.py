@@ -6,7 +6,7 @@ It includes a general RateLimiter class and a specific CommandRateLimiter for us
 """
 
 import time
-from collections import defaultdict
+from collections import OrderedDict, deque
 from discord.ext import commands
 
 from utils.custom_exceptions import RateLimitError
@@ -19,17 +19,22 @@ class RateLimiter:
     calls within a given time frame.
     """
 
-    def __init__(self, max_calls: int, time_frame: float):
+    def __init__(self, max_calls: int, time_frame: float, max_keys: int = 100_000):
         """
         Initialize the RateLimiter.
 
         Args:
             max_calls (int): The maximum number of calls allowed within the time frame.
             time_frame (float): The time frame in seconds.
+            max_keys (int): The maximum number of keys tracked; the least recently used is evicted.
         """
         self.max_calls = max_calls
         self.time_frame = time_frame
-        self.call_history = defaultdict(list)
+        self.max_keys = max_keys
+        # Per-key call timestamps, oldest first; never longer than max_calls.
+        # Kept in least-recently-checked order so the map can be capped at max_keys.
+        self.call_history = OrderedDict()
+        self._last_sweep = time.monotonic()
 
     def check_rate_limit(self, key):
         """
@@ -41,11 +46,20 @@ class RateLimiter:
         Raises:
             RateLimitError: If the rate limit has been exceeded.
         """
-        current_time = time.time()
-        history = self.call_history[key]
+        current_time = time.monotonic()
+        if current_time - self._last_sweep >= self.time_frame:
+            self._sweep(current_time)
+        call_history = self.call_history
+        history = call_history.get(key)
+        if history is None:
+            history = call_history[key] = deque(maxlen=self.max_calls)
+            if len(call_history) > self.max_keys:
+                call_history.popitem(last=False)
+        else:
+            call_history.move_to_end(key)
         # Remove stale entries
         while history and current_time - history[0] > self.time_frame:
-            history.pop(0)
+            history.popleft()
         if len(history) >= self.max_calls:
             raise RateLimitError(f"Rate limit exceeded for key: {key}")
         history.append(current_time)
@@ -60,10 +74,14 @@ class RateLimiter:
         Returns:
             int: The number of remaining calls allowed.
         """
-        current_time = time.time()
-        history = self.call_history[key]
-        history = [t for t in history if current_time - t < self.time_frame]
-        self.call_history[key] = history
+        # Looking up an unknown key doesn't add it
+        history = self.call_history.get(key)
+        if history is None:
+            return self.max_calls
+        current_time = time.monotonic()
+        # Timestamps are in order, so stale entries are all at the left
+        while history and current_time - history[0] >= self.time_frame:
+            history.popleft()
         return max(0, self.max_calls - len(history))
 
     def get_reset_time(self, key) -> float:
@@ -76,13 +94,24 @@ class RateLimiter:
         Returns:
             float: The number of seconds until the rate limit resets.
         """
-        history = self.call_history.get(key, [])
+        history = self.call_history.get(key)
         if not history:
             return 0.0
-        current_time = time.time()
+        current_time = time.monotonic()
         oldest_call = history[0]
         return max(0.0, self.time_frame - (current_time - oldest_call))
 
+    def _sweep(self, current_time: float):
+        """Drop keys with no calls inside the time frame, so idle keys don't accumulate."""
+        time_frame = self.time_frame
+        stale_keys = [
+            key for key, history in self.call_history.items()
+            if not history or current_time - history[-1] > time_frame
+        ]
+        for key in stale_keys:
+            del self.call_history[key]
+        self._last_sweep = current_time
+
 class CommandRateLimiter(RateLimiter):
     """
     A rate limiter specifically for Discord bot commands.
@@ -136,5 +165,7 @@ def dynamic_cooldown(rate: int, per: float):
     def cooldown_check(ctx):
         if ctx.author.guild_permissions.administrator:
             return None  # No cooldown for administrators
+        # Must be a new object: discord.py caches the returned Cooldown as this bucket's own
+        # mutable state, and only calls this when a bucket is first created
         return commands.Cooldown(rate, per)
     return commands.dynamic_cooldown(cooldown_check)
\ No newline at end of file
@@ -12,15 +12,24 @@ from bot.cogs.thread_management import ThreadManagement
 from bot.utils.config_manager import ConfigManager
 from bot.utils.custom_exceptions import ThreadManagementError
 
+@pytest.fixture(scope='session')
+def config():
+    """
+    Fixture to load the bot configuration once for the whole test session.
+
+    Returns:
+        ConfigManager: The shared configuration manager.
+    """
+    return ConfigManager('config/bot_config.yaml')
+
 @pytest.fixture
-def thread_management():
+def thread_management(config):
     """
     Fixture to create a ThreadManagement instance for testing.
 
     Returns:
         ThreadManagement: An instance of the ThreadManagement cog.
     """
-    config = ConfigManager('config/bot_config.yaml')
     return ThreadManagement(Mock(), config)
 
 @pytest.mark.asyncio